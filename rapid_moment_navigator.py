@@ -1,9 +1,13 @@
 import os
 import re
+import stat
 import glob
+import textwrap
+import functools
 import subprocess
 import tkinter as tk
-from tkinter import ttk, scrolledtext, Label, Frame, filedialog, messagebox
+from tkinter import ttk, scrolledtext, Label, Frame
+from tkinter import font as tkfont
 import threading
 from pathlib import Path
 import sys
@@ -13,13 +17,238 @@ import logging
 import time
 import traceback
 import multiprocessing
-import tempfile
+import mmap
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 
 # Constants
 PREFS_FILENAME = "rapid_navigator_prefs.json"
 RESOLVE_PATHS_FILENAME = "resolve_paths.json"
 
+# Popen keyword arguments that keep player launches on the posix_spawn fast
+# path on Python 3.8+ (no preexec_fn/pass_fds and close_fds=False avoid the
+# slow fork+exec fallback). Windows already uses a single CreateProcess call,
+# so no extra flags are needed there.
+PLAYER_POPEN_KWARGS = {"close_fds": False} if os.name == "posix" else {}
+
+# Keeps background ffprobe runs from flashing a console window on Windows;
+# zero everywhere else
+_NO_WINDOW_FLAG = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Single-pass timecode matcher covering HH:MM:SS, MM:SS, HH:MM:SS:FF and
+# HH:MM:SS.MS / HH:MM:SS,MS forms. Compiled once so per-row conversions skip
+# the split/membership-test cascade.
+_TC_RE = re.compile(r'^(?:(\d+):)?(\d+):(\d+)(?::(\d+)|[.,](\d+))?$')
+
+# Media-file extensions recognized by the directory walker (lowercase, no dot)
+_SUB_EXTS = {'srt'}
+_VIDEO_EXTS = {'mp4', 'mkv', 'avi', 'mov', 'wmv', 'm4v', 'flv', 'webm',
+               'mp3', 'm4a', 'wav', 'aac', 'ogg'}
+# The search pass additionally accepts plain-text transcripts
+_SEARCH_SUB_EXTS = {'srt', 'txt'}
+
+def _walk_media(root):
+    """Yield (is_subtitle, path) for every subtitle/video file under root.
+
+    Uses an explicit os.scandir stack instead of os.walk: DirEntry carries
+    the file-type bits from the kernel's directory read, so classifying
+    entries needs no extra stat syscalls, and subtitles and videos are
+    collected in a single traversal instead of one extension scan each.
+    Hidden directories are skipped like the os.walk-based scans do.
+
+    Paths are interned: the same path string ends up held by the
+    subtitle-to-video map, the parse cache, and every search result row
+    that references it, and rescans rebuild all of those. Interning makes
+    each rebuild hand back the one canonical string object instead of a
+    fresh copy per holder.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith('.'):
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        _, sep, ext = name.rpartition('.')
+                        if sep:
+                            # Extensions are almost always lowercase already;
+                            # islower() is allocation-free, so only pay for
+                            # a lowercased copy when one is actually needed
+                            if not ext.islower():
+                                ext = ext.lower()
+                            if ext in _SUB_EXTS:
+                                yield True, sys.intern(entry.path)
+                            elif ext in _VIDEO_EXTS:
+                                yield False, sys.intern(entry.path)
+        except OSError:
+            continue
+
+# How many result rows to materialize as widgets per render pass; further
+# rows stay queued as plain dicts until the user scrolls near the bottom
+_RESULT_RENDER_CHUNK = 40
+
+# Patterns used on the subtitle parse/search hot paths, compiled once per
+# process instead of per call
+_SRT_ENTRY_RE = re.compile(r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3})\s+-->\s+(\d{2}:\d{2}:\d{2},\d{3})\n((?:.+\n)+?)(?:\n|$)')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_MULTISPACE_RE = re.compile(r'  +')
+_SHORT_NUM_RE = re.compile(r'\b\d{1,2}\b')
+_LAST_WORD_RE = re.compile(r'\S+\s*$')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+@functools.lru_cache(maxsize=None)
+def _clean_filename(filename):
+    """Clean a filename to improve matching chances.
+
+    Memoized: the partial-match pass cleans the same video names once per
+    subtitle, so repeat calls must cost a dict hit, not regex work.
+    """
+    # Convert to lowercase
+    filename = filename.lower()
+    # Remove common separators
+    filename = filename.replace('_', ' ').replace('-', ' ').replace('.', ' ')
+    # Remove common words/patterns that might differ between subtitle and video filenames
+    remove_patterns = ['disc', 'season', 'title', 'episode', 's0', 'e0', 'x0']
+    for pattern in remove_patterns:
+        filename = filename.replace(pattern, '')
+    # Remove numbers that might be disc/episode numbers
+    filename = _SHORT_NUM_RE.sub('', filename)
+    # Remove extra spaces
+    filename = _WS_RE.sub(' ', filename).strip()
+    return filename
+
+def _tc_core(hours, minutes, seconds, frames, ms, fps):
+    """
+    Numeric core of timecode-to-frame conversion, kept free of string
+    handling and self so it stays a cheap pure function
+
+    Args:
+        frames (int): FF field of an HH:MM:SS:FF timecode, or -1 if absent
+        ms (int): Millisecond field (0 if absent); values under 100 are
+                  treated as frame counts rather than milliseconds
+
+    Returns:
+        int: Frame number
+    """
+    total_seconds = hours * 3600 + minutes * 60 + seconds
+
+    # DaVinci Resolve style timecode with HH:MM:SS:FF
+    if frames >= 0:
+        return int(total_seconds * fps + frames)
+
+    # Calculate total frames with proper millisecond handling
+    if ms > 0:
+        if ms < 100:  # If ms is less than 100, assume it's already in frames rather than milliseconds
+            frame_portion = ms
+        else:  # Convert milliseconds to frames
+            frame_portion = (ms / 1000.0) * fps
+    else:
+        frame_portion = 0
+
+    return int(total_seconds * fps + frame_portion)
+
+@functools.lru_cache(maxsize=4096)
+def _tc_to_frames_cached(timecode, fps):
+    """
+    Memoized parse-and-convert: subtitle files repeat the same stamp strings
+    across searches, so a revisited (timecode, fps) pair is a dict lookup
+    instead of a regex match
+
+    Returns:
+        int or None: Frame number, or None if the timecode doesn't parse
+    """
+    match = _TC_RE.match(timecode)
+    if not match:
+        return None
+
+    hours, minutes, seconds, frames, ms_part = match.groups()
+    return _tc_core(
+        int(hours) if hours else 0,
+        int(minutes),
+        int(seconds),
+        int(frames) if frames is not None else -1,
+        int(ms_part) if ms_part else 0,
+        fps,
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _tc_to_seconds_cached(timecode):
+    """
+    Memoized seconds conversion for HH:MM:SS / MM:SS with optional
+    comma- or period-separated milliseconds
+
+    Returns:
+        int or float: Total seconds, or 0 if the timecode doesn't parse
+        (frame-suffixed HH:MM:SS:FF forms also return 0, as before, since
+        they need a framerate to interpret)
+    """
+    match = _TC_RE.match(timecode)
+    if not match:
+        return 0
+
+    hours, minutes, seconds, frames, ms_part = match.groups()
+    if frames is not None:
+        return 0
+
+    total_seconds = int(hours) * 3600 + int(minutes) * 60 + int(seconds) if hours else int(minutes) * 60 + int(seconds)
+    if ms_part:
+        total_seconds += int(ms_part) / 1000.0
+    return total_seconds
+
+@functools.lru_cache(maxsize=8192)
+def _fmt_tc(total_seconds):
+    """Memoized HH:MM:SS formatting for whole-second values"""
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+# Probe script run in a subprocess to verify DaVinciResolveScript imports
+# safely. Kept at module scope so the literal is built once instead of being
+# re-assembled on every safety test; filled in with str.format at call time.
+_RESOLVE_PROBE_TEMPLATE = '''
+import os
+import sys
+
+# Set required environment variables
+os.environ["RESOLVE_SCRIPT_API"] = r"{api_path}"
+os.environ["RESOLVE_SCRIPT_LIB"] = r"{lib_path}"
+
+print(f"Test subprocess - API path: {api_path}")
+print(f"Test subprocess - LIB path: {lib_path}")
+
+# Use the SAME simplified approach that works in the main method
+if r"{api_path}" and os.path.exists(r"{api_path}"):
+    if r"{api_path}" not in sys.path:
+        sys.path.append(r"{api_path}")
+        print(f"Added API path to Python path: {api_path}")
+
+    # CRITICAL: Also add the Modules subdirectory (this was the key fix!)
+    modules_path = os.path.join(r"{api_path}", "Modules")
+    if os.path.exists(modules_path) and modules_path not in sys.path:
+        sys.path.append(modules_path)
+        print(f"Added Modules path to Python path: {{modules_path}}")
+
+print(f"Final sys.path: {{sys.path}}")
+
+# Try the import
+try:
+    import DaVinciResolveScript
+    print("SUCCESS: DaVinciResolveScript imported successfully in subprocess")
+    sys.exit(0)
+except ImportError as e:
+    print(f"FAILED: Import error in subprocess: {{e}}")
+    sys.exit(1)
+except Exception as e:
+    print(f"FAILED: Unexpected error in subprocess: {{e}}")
+    sys.exit(1)
+'''
+
 DEFAULT_PREFS = {
     "directories": [],
     "exclude_current_dir": False,
@@ -32,9 +261,119 @@ DEFAULT_PREFS = {
     "window_proportional_scaling": True  # Scale all windows proportionally when one is changed
 }
 
+_EMPTY_EDITOR_CONFIG = MappingProxyType({})
+
+@functools.lru_cache(maxsize=None)
+def _editor_config(editor_name):
+    """Read-only view of an editor's registry entry ({} for unknown names).
+
+    The registry is fixed at class definition, so lookups are memoized for
+    the process lifetime; the proxy keeps cached entries immutable.
+    """
+    config = RapidMomentNavigator.EDITOR_REGISTRY.get(editor_name)
+    return MappingProxyType(config) if config is not None else _EMPTY_EDITOR_CONFIG
+
+# Guidance-dialog copy, built once at import instead of on every dialog open.
+# The fixed strings are pre-wrapped here so the labels don't need wraplength,
+# which makes Tk re-wrap the text on every <Configure>
+_GUIDANCE_TEXT = (
+    "Rapid Moment Navigator needs to know where your media is located.\n\n"
+    "You need to add directories that contain subtitle (.SRT) files and their corresponding video files.\n\n"
+    "How it works:\n"
+    "1. The app will scan directories for subtitle files (.SRT) and video files with matching names\n"
+    "2. It can scan nested folder structures - media can be anywhere in the folder hierarchy\n"
+    "3. Video files should have the same base name as their subtitle files\n"
+    "4. You can add multiple media directories\n\n"
+    "You have two options:"
+)
+_GUIDANCE_TEXT = "\n".join(textwrap.fill(_line, 78) for _line in _GUIDANCE_TEXT.split("\n"))
+
+_HELP_TEXT = (
+    "Detailed Help:\n\n"
+    "Subtitle files (.SRT) should match the video file names.\n"
+    "Example:\n"
+    "- video_file.mp4 → video_file.srt\n\n"
+    "The app will try to match files even with slight differences in naming.\n"
+    "Each directory you add is treated as a separate 'show' in the dropdown menu.\n\n"
+    "When you add a directory, the entire folder structure is scanned for matching\n"
+    "subtitle and video files. Files can be in subdirectories.\n\n"
+    "After adding directories, use the search box to find specific dialog,\n"
+    "then click on the timecode to play the video at that exact moment."
+)
+
+# Platform file-manager launcher, resolved once at import time like the
+# Resolve defaults below
+if sys.platform.startswith('win'):
+    _OPEN_DIR = os.startfile
+elif sys.platform == 'darwin':
+    _OPEN_DIR = lambda p: subprocess.Popen(['open', p])
+else:
+    _OPEN_DIR = lambda p: subprocess.Popen(['xdg-open', p])
+
+# Wheel-event-to-scroll-units conversion, also resolved once per platform so
+# the per-event handlers skip the cross-platform branching on every tick
+if sys.platform == 'darwin':
+    def _scroll_amount(event):
+        # macOS MouseWheel delta is already in small line-sized steps
+        if event.delta:
+            return -event.delta
+        return -1 if getattr(event, 'num', 0) == 4 else 1
+elif sys.platform.startswith('win'):
+    def _scroll_amount(event):
+        # Windows delta is 120 per wheel notch
+        return int(-event.delta / 120)
+else:
+    def _scroll_amount(event):
+        # X11 reports wheel motion as Button-4/5 presses with delta 0
+        num = getattr(event, 'num', 0)
+        if num == 4:
+            return -1
+        if num == 5:
+            return 1
+        return int(-event.delta / 120) if event.delta else -1
+
 # Global variable for DaVinci Resolve script module
 dvr_script = None
 
+# tkinter's dialog submodules pull in extra Tk machinery, so they are loaded
+# on first use instead of at startup
+filedialog = None
+messagebox = None
+
+def _load_dialog_modules():
+    """Import tkinter.filedialog/messagebox on demand (no-op after the first call)"""
+    global filedialog, messagebox
+    if messagebox is None:
+        from tkinter import filedialog as _filedialog, messagebox as _messagebox
+        filedialog = _filedialog
+        messagebox = _messagebox
+
+# Default DaVinci Resolve scripting locations per platform, resolved once at
+# import time since sys.platform never changes mid-process
+_RESOLVE_DEFAULTS = {
+    "win": (r"C:\ProgramData\Blackmagic Design\DaVinci Resolve\Support\Developer\Scripting",
+            r"C:\Program Files\Blackmagic Design\DaVinci Resolve\fusionscript.dll"),
+    "darwin": (r"/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting",
+               r"/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so"),
+    "linux": (r"/opt/resolve/Developer/Scripting",
+              r"/opt/resolve/libs/Fusion/fusionscript.so"),
+}
+_DEFAULT_API_PATH, _DEFAULT_LIB_PATH = next(
+    (paths for prefix, paths in _RESOLVE_DEFAULTS.items() if sys.platform.startswith(prefix)),
+    ("", ""),
+)
+
+def _noop_debug_print(message, *args):
+    """Replacement bound to debug_print when debug mode is off"""
+    pass
+
+def _safe_stat(path):
+    """Return os.stat(path) or None - one syscall where exists/isfile/isdir would take two"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 def find_module_locations(base_path):
     """Find possible locations of DaVinciResolveScript.py based on a base path.
     Only checks the standard location and directly in the specified path."""
@@ -58,17 +397,50 @@ def find_module_locations(base_path):
         "module_paths": module_paths  # Full paths to the module files
     }
 
+# Shared link font for the clickable labels below. Created lazily because a
+# tkfont.Font needs a running Tk instance; after that, every link widget
+# reuses the same object instead of making Tk parse a font tuple apiece
+_UNDERLINE_FONT = None
+
+def _get_underline_font():
+    """Return the shared underline font, creating it on first use"""
+    global _UNDERLINE_FONT
+    if _UNDERLINE_FONT is None:
+        _UNDERLINE_FONT = tkfont.Font(family="TkDefaultFont", size=10, underline=1)
+    return _UNDERLINE_FONT
+
+# Shared tooltip window for the clickable import links. Building a Toplevel
+# (plus frame and label) on every hover is surprisingly expensive in Tk, so
+# one withdrawn window is created lazily and every hover just repositions
+# and retexts it
+_SHARED_TOOLTIP = None
+
+def _get_shared_tooltip():
+    """Return the shared (Toplevel, Label) tooltip pair, creating it on first use"""
+    global _SHARED_TOOLTIP
+    if _SHARED_TOOLTIP is None:
+        tip = tk.Toplevel()
+        tip.wm_overrideredirect(True)
+        tip.withdraw()
+        frame = tk.Frame(tip, background="#ffffe0", borderwidth=1, relief="solid")
+        frame.pack(ipadx=3, ipady=2)
+        label = tk.Label(frame, text="", justify="left",
+                      background="#ffffe0", fg="#000000",
+                      wraplength=250, font=("TkDefaultFont", 9))
+        label.pack()
+        _SHARED_TOOLTIP = (tip, label)
+    return _SHARED_TOOLTIP
+
 class ClickableEditorTimecode(Label):
     """A clickable label widget for editor timecode links - works with any editor or media system"""
     def __init__(self, parent, timecode, timeline, callback, start_frame, item_ref=None, **kwargs):
+        kwargs.setdefault("font", _get_underline_font())
         super().__init__(parent, text=timecode, cursor="hand2", fg="blue", **kwargs)
         self.timeline = timeline
         self.callback = callback
         self.start_frame = start_frame
         self.item_ref = item_ref
         self.bind("<Button-1>", self._on_click)
-        # Add underline
-        self.config(font=("TkDefaultFont", 10, "underline"))
         
     def _on_click(self, event):
         """Handle click event"""
@@ -81,12 +453,11 @@ ClickableResolveTimecode = ClickableEditorTimecode
 class ClickableTimecode(Label):
     """A clickable label widget for timecodes"""
     def __init__(self, parent, timecode, result, callback, **kwargs):
+        kwargs.setdefault("font", _get_underline_font())
         super().__init__(parent, text=timecode, cursor="hand2", fg="blue", **kwargs)
         self.result = result
         self.callback = callback
         self.bind("<Button-1>", self._on_click)
-        # Add underline
-        self.config(font=("TkDefaultFont", 10, "underline"))
         
     def _on_click(self, event):
         """Handle click event"""
@@ -95,19 +466,17 @@ class ClickableTimecode(Label):
 class ClickableImport(Label):
     """A clickable label widget for import buttons"""
     def __init__(self, parent, text, result, callback, tooltip=None, **kwargs):
+        kwargs.setdefault("font", _get_underline_font())
         super().__init__(parent, text=text, cursor="hand2", fg="blue", **kwargs)
         self.result = result
         self.callback = callback
         self.bind("<Button-1>", self._on_click)
-        # Add underline
-        self.config(font=("TkDefaultFont", 10, "underline"))
         
         # Add tooltip functionality
         self.tooltip_text = tooltip
         if tooltip:
             self.bind("<Enter>", self._on_enter)
             self.bind("<Leave>", self._on_leave)
-            self.tooltip = None
             self.tooltip_timer = None
         
     def _on_click(self, event):
@@ -127,27 +496,18 @@ class ClickableImport(Label):
         x, y, _, _ = self.bbox("insert")
         x += self.winfo_rootx() + 25
         y += self.winfo_rooty() + 25
-        
-        # Create a toplevel window
-        self.tooltip = tk.Toplevel(self)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-        
-        # Create tooltip content
-        frame = tk.Frame(self.tooltip, background="#ffffe0", borderwidth=1, relief="solid")
-        frame.pack(ipadx=3, ipady=2)
-        
-        label = tk.Label(frame, text=self.tooltip_text, justify="left",
-                      background="#ffffe0", fg="#000000", 
-                      wraplength=250, font=("TkDefaultFont", 9))
-        label.pack()
-    
+
+        # Reposition and retext the shared tooltip window
+        tip, label = _get_shared_tooltip()
+        tip.wm_geometry(f"+{x}+{y}")
+        label.configure(text=self.tooltip_text)
+        tip.deiconify()
+
     def _on_leave(self, event):
         """Hide tooltip and cancel timer when mouse leaves the widget"""
         self._cancel_timer()
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        if _SHARED_TOOLTIP:
+            _SHARED_TOOLTIP[0].withdraw()
             
     def _cancel_timer(self):
         """Cancel any pending tooltip timer"""
@@ -185,16 +545,26 @@ class RapidMomentNavigator:
         self.root = root
         self.root.title("Rapid Moment Navigator")
         
-        # Debug mode setting
+        # Debug mode setting. With debug off, the instance attribute shadows
+        # the method with a no-op so the dozens of debug_print call sites pay
+        # only an attribute lookup and an empty call
         self.debug = debug
+        if not debug:
+            self.debug_print = _noop_debug_print
         
         # Store the script directory for preferences and other file operations (needed first)
         self.script_dir = os.path.abspath(os.path.dirname(__file__))
         self.debug_print(f"Script directory: {self.script_dir}")
+
+        # Cache the working directory and preferences path once; neither
+        # changes after startup, so callers shouldn't pay for re-resolving them
+        self._cwd = os.path.abspath(".")
+        self._prefs_path = os.path.join(self.script_dir, PREFS_FILENAME)
         
         # Initialize preferences first
         self.preferences = self.load_preferences()
-        
+        self._refresh_min_duration_cache()
+
         # Calculate the centered position for the main window using saved or default size
         window_width, window_height = self.get_window_size("main_window")
         screen_width = root.winfo_screenwidth()
@@ -206,8 +576,11 @@ class RapidMomentNavigator:
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
         
         # Initialize subtitle cache system
-        self.subtitle_cache = {}  # Cache for subtitle items
-        self.cache_lock = threading.Lock()  # Thread safety for cache operations
+        # Cache for subtitle items. Treated as copy-on-write: writers build
+        # a fresh dict and rebind the attribute (atomic under the GIL), so
+        # readers can snapshot self.subtitle_cache without taking a lock
+        self.subtitle_cache = {}
+        self.cache_lock = threading.Lock()  # Guards the is_caching flag only
         self.cache_update_thread = None
         self.is_caching = False
         self.last_timeline_id = None
@@ -234,6 +607,7 @@ class RapidMomentNavigator:
         # Active canvas tracking for scroll management
         self.active_scroll_canvases = {}  # canvas -> handler mapping
         self.current_scroll_canvas = None  # Currently focused canvas for scrolling
+        self._install_global_scroll_handler()
         
         # Setup exception handling for Tkinter
         self.setup_exception_handler()
@@ -329,7 +703,9 @@ class RapidMomentNavigator:
         self.results_scrollbar.pack(side="right", fill="y")
         
         self.results_canvas.pack(side="left", fill="both", expand=True)
-        self.results_canvas.configure(yscrollcommand=self.results_scrollbar.set)
+        # Route scroll updates through a hook so queued result rows can be
+        # rendered on demand as the user nears the bottom
+        self.results_canvas.configure(yscrollcommand=self._on_results_scroll)
         
         # Frame inside canvas to hold results
         self.results_container = ttk.Frame(self.results_canvas)
@@ -353,134 +729,261 @@ class RapidMomentNavigator:
         self.status_bar = ttk.Label(self.main_frame, textvariable=self.status_var, relief="sunken", anchor="w")
         self.status_bar.pack(fill="x", padx=5, pady=5)
         
-        # Initialize the application
-        self.debug_print("Initializing shows and mapping...")
-        shows_paths = self.load_shows()
-        
-        # Show the UI immediately with a temporary status
-        if len(self.show_name_to_path_map) > 0:
-            self.debug_print(f"Application initialized with {len(self.show_name_to_path_map)} shows - mapping subtitles in background")
-            self.status_var.set(f"Loading... Found {len(self.show_name_to_path_map)} shows, mapping subtitle files...")
-            
-            # Start mapping in background
-            self._map_subtitles_in_background()
-        else:
-            self.debug_print("No shows found during initialization")
-            self.status_var.set("No media found. Please add directories containing subtitle files and videos.")
-        
+        # Initialize the application. The directory scan hits the disk for
+        # every configured root, so it is deferred past the first paint - the
+        # window appears immediately and shows stream in right after
+        self.debug_print("Deferring initial show scan until after first paint")
+        self.root.after(10, self._initial_load_shows)
+
         # Store the search results for later reference
         self.search_results = []
-        
+
+        # Cached DaVinci Resolve object handles - each lookup crosses the
+        # scripting bridge, so reuse them between imports until invalidated
+        self._resolve_cache = {"project": None, "project_fps": None, "media_pool": None, "timeline": None}
+
+        # Resolved ffprobe command, discovered once on first framerate
+        # detection (False means "looked and not found, use the default")
+        self._ffprobe_cmd = None
+
+        # Last page we know Resolve is on - lets imports skip the
+        # GetCurrentPage round-trip and page-switch wait entirely
+        self._resolve_last_page = None
+
+        # Parsed resolve_paths.json keyed by mtime, plus per-path results of
+        # find_module_locations, so repeat API initializations skip the JSON
+        # parse and the directory walks
+        self._resolve_config_cache = {"mtime_ns": None, "config": None}
+        self._module_locations_cache = {}
+
+        # Settings dialogs are built once and hidden on close instead of
+        # destroyed, so reopening skips widget creation and layout
+        self._settings_dialog = None
+        self._general_settings_dialog = None
+        self._guidance_dialog = None
+        # Last-known root geometry (x, y, w, h), kept fresh by <Configure>
+        self._root_geom = None
+        # Screen dimensions never change mid-process; query Tk once
+        self._screen_w = root.winfo_screenwidth()
+        self._screen_h = root.winfo_screenheight()
+        # Queued (kind, payload) result rows awaiting widget creation, plus a
+        # count of rows already turned into widgets and a reentrancy guard
+        self._result_queue = deque()
+        self._results_rendered = 0
+        self._result_render_scheduled = False
+        # Parsed SRT entries per file, keyed by st_mtime_ns, so repeated
+        # searches skip the read + regex parse for unchanged files
+        self._srt_parse_cache = {}
+        # Per-show traversal results shared between the load_shows probe and
+        # the subtitle mapping pass; cleared at the start of every load
+        self._walk_cache = {}
+        # Bound-method dispatch for the selected editor; rebuilt on selection
+        # change by _rebuild_editor_dispatch
+        self._editor_fns = {"name": None, "known": False}
+        # Pending after() handle for the debounced scroll-region recompute
+        self._scroll_region_after = None
+        # Coalesced wheel input: accumulated delta, the handler it belongs
+        # to, and whether an idle flush is already queued
+        self._pending_scroll = 0
+        self._scroll_coalesce_handler = None
+        self._scroll_flush_scheduled = False
+
         # Initialize safe mode flag for editors
         self.resolve_in_safe_mode = False
+
+        # Whether the safe-mode error dialog has been shown already - repeat
+        # clicks only get a status bar message instead of a new dialog
+        self._resolve_safe_mode_notified = False
         
         # Track if guidance dialog is currently showing
         self.guidance_dialog_showing = False
         
-        # Store the need to show guidance dialog
-        self.needs_guidance_dialog = len(self.show_name_to_path_map) == 0
-        
-        # Wait for window to stabilize before showing guidance dialog
-        # This helps prevent the "jump" effect where the window moves after initial rendering
-        if self.needs_guidance_dialog:
-            self.root.after(300, self._delayed_show_guidance)
-        
+        # Store the need to show guidance dialog - decided once the deferred
+        # initial scan has actually run
+        self.needs_guidance_dialog = False
+        self._guidance_after_id = None
+
         # Initialize UI variables needed for application state loading
         self.current_dir_status_var = tk.StringVar()
         self.min_duration_var = tk.BooleanVar()
         self.min_duration_seconds_var = tk.StringVar()
         
-        # Load application state
+        # Load application state (the exception hook was already installed
+        # near the top of __init__)
         self.load_app_state()
         
-        # Set up exception handling
-        self.setup_exception_handler()
+        # Resolve the saved editor's dispatch methods up front
+        self._rebuild_editor_dispatch(self.editor_var.get())
         
         # Setup focus detection for cache management
         self._setup_focus_detection()
 
-        # Check if any shows were loaded - use the actual show count
-        show_count = len(self.show_name_to_path_map)
-        if not show_count:
-            # No shows loaded, show guidance
-            self.root.after(100, self._delayed_show_guidance)
-    
+    def _initial_load_shows(self):
+        """Run the first directory scan, scheduled after the window paints.
+
+        Kicked off from __init__ via after() so a large library doesn't
+        block the main window from appearing.
+        """
+        self.debug_print("Initializing shows and mapping...")
+        self.load_shows()
+
+        if len(self.show_name_to_path_map) > 0:
+            self.debug_print(f"Application initialized with {len(self.show_name_to_path_map)} shows - mapping subtitles in background")
+            self.status_var.set(f"Loading... Found {len(self.show_name_to_path_map)} shows, mapping subtitle files...")
+
+            # Start mapping in background
+            self._map_subtitles_in_background()
+        else:
+            self.debug_print("No shows found during initialization")
+            self.status_var.set("No media found. Please add directories containing subtitle files and videos.")
+
+            # Wait for the window to stabilize before showing the guidance
+            # dialog - this prevents the "jump" effect where the window
+            # moves after initial rendering
+            self.needs_guidance_dialog = True
+            if self._guidance_after_id is None:
+                self._guidance_after_id = self.root.after(300, self._delayed_show_guidance)
+
     def _get_editor_config(self, editor_name=None):
         """Get configuration for the specified editor or current editor"""
         if editor_name is None:
             editor_name = self.editor_var.get()
-        return self.EDITOR_REGISTRY.get(editor_name, {})
+        return _editor_config(editor_name)
         
+    def _rebuild_editor_dispatch(self, editor_name):
+        """Resolve the selected editor's methods into bound callables.
+
+        Runs once per selection change, so the per-click dispatch below is
+        one dict lookup instead of registry lookup + hasattr + getattr.
+        """
+        config = _editor_config(editor_name)
+
+        def resolve(key):
+            # Prefer the function object frozen at class-load time; fall
+            # back to name lookup for entries registered dynamically
+            fn = config.get(key + "_fn")
+            if fn is not None:
+                return fn.__get__(self)
+            method_name = config.get(key)
+            if method_name and hasattr(self, method_name):
+                return getattr(self, method_name)
+            return None
+
+        self._editor_fns = {
+            "name": editor_name,
+            "known": bool(config),
+            "ensure": resolve("ensure_ready_method"),
+            "import_media": resolve("import_media_method"),
+            "import_clip": resolve("import_clip_method"),
+            "framerate": resolve("framerate_detection_method"),
+        }
+
+    def _get_editor_fns(self, editor_name=None):
+        """Return the resolved dispatch table, rebuilding on a name change"""
+        if editor_name is None:
+            editor_name = self.editor_var.get()
+        if self._editor_fns["name"] != editor_name:
+            self._rebuild_editor_dispatch(editor_name)
+        return self._editor_fns
+
     def _ensure_editor_ready(self, editor_name=None):
         """Generic method to ensure any editor is ready"""
-        config = self._get_editor_config(editor_name)
-        if not config:
-            self.debug_print(f"❌ Unknown editor: {editor_name or self.editor_var.get()}")
+        fns = self._get_editor_fns(editor_name)
+        if not fns["known"]:
+            self.debug_print("❌ Unknown editor: %s", fns["name"])
             return False
             
-        ensure_method_name = config.get("ensure_ready_method")
-        if ensure_method_name and hasattr(self, ensure_method_name):
-            ensure_method = getattr(self, ensure_method_name)
-            return ensure_method()
+        if fns["ensure"] is not None:
+            return fns["ensure"]()
         else:
-            self.debug_print(f"⚠️ No readiness check available for {editor_name or self.editor_var.get()}")
+            self.debug_print("⚠️ No readiness check available for %s", fns["name"])
             return True  # Assume ready if no check available
             
-    def _import_media_to_editor(self, subtitle_file, start_time, end_time):
+    def _import_media_to_editor(self, subtitle_file, start_time, end_time, editor_name=None):
         """Generic method to import media to any editor"""
-        editor_name = self.editor_var.get()
-        config = self._get_editor_config(editor_name)
+        fns = self._get_editor_fns(editor_name)
         
-        if not config:
-            self.debug_print(f"❌ Unknown editor: {editor_name}")
+        if not fns["known"]:
+            self.debug_print("❌ Unknown editor: %s", fns["name"])
             return
             
-        import_method_name = config.get("import_media_method")
-        if import_method_name and hasattr(self, import_method_name):
-            import_method = getattr(self, import_method_name)
-            import_method(subtitle_file, start_time, end_time)
+        if fns["import_media"] is not None:
+            fns["import_media"](subtitle_file, start_time, end_time)
         else:
-            self.debug_print(f"⚠️ Media import not supported for {editor_name}")
+            self.debug_print("⚠️ Media import not supported for %s", fns["name"])
             
-    def _import_clip_to_editor(self, subtitle_file, start_time, end_time):
+    def _import_clip_to_editor(self, subtitle_file, start_time, end_time, editor_name=None):
         """Generic method to import clips to any editor"""
-        editor_name = self.editor_var.get()
-        config = self._get_editor_config(editor_name)
+        fns = self._get_editor_fns(editor_name)
         
-        if not config:
-            self.debug_print(f"❌ Unknown editor: {editor_name}")
+        if not fns["known"]:
+            self.debug_print("❌ Unknown editor: %s", fns["name"])
             return
             
-        import_method_name = config.get("import_clip_method")
-        if import_method_name and hasattr(self, import_method_name):
-            import_method = getattr(self, import_method_name)
-            import_method(subtitle_file, start_time, end_time)
+        if fns["import_clip"] is not None:
+            fns["import_clip"](subtitle_file, start_time, end_time)
         else:
-            self.debug_print(f"⚠️ Clip import not supported for {editor_name}")
+            self.debug_print("⚠️ Clip import not supported for %s", fns["name"])
             
-    def _detect_framerate_for_editor(self, subtitle_file):
+    def _detect_framerate_for_editor(self, subtitle_file, editor_name=None):
         """Generic method to detect framerate using current editor's method"""
-        editor_name = self.editor_var.get()
-        config = self._get_editor_config(editor_name)
+        fns = self._get_editor_fns(editor_name)
         
-        if not config:
-            self.debug_print(f"❌ Unknown editor: {editor_name}")
+        if not fns["known"]:
+            self.debug_print("❌ Unknown editor: %s", fns["name"])
             return None
             
         # Try editor-specific framerate detection first
-        framerate_method_name = config.get("framerate_detection_method")
-        if framerate_method_name and hasattr(self, framerate_method_name):
-            framerate_method = getattr(self, framerate_method_name)
-            framerate = framerate_method(subtitle_file)
+        if fns["framerate"] is not None:
+            framerate = fns["framerate"](subtitle_file)
             if framerate:
                 return framerate
                 
-        # Fallback to generic detection
-        video_file = self.subtitle_to_video_map.get(subtitle_file)
-        if video_file:
-            return self.detect_video_framerate(video_file)
+        # Fallback to generic detection, reusing any framerate already cached
+        # on the mapping entry so repeat clicks don't respawn ffprobe
+        video_info = self.subtitle_to_video_map.get(subtitle_file)
+        if video_info:
+            fps = video_info.get("fps")
+            if fps:
+                return fps
+            fps = self.detect_video_framerate(video_info["path"])
+            if fps:
+                video_info["fps"] = fps
+            return fps
         return None
 
+    def _detect_framerates_bulk(self, subtitle_files):
+        """Probe framerates for the given subtitle files' videos in parallel.
+
+        ffprobe cost is dominated by process startup, so overlapping the
+        spawns with a small thread pool makes prewarming a batch of result
+        files far cheaper than serial on-click probes. Entries that already
+        carry a framerate are skipped.
+        """
+        pending = []
+        seen_paths = set()
+        for subtitle_file in subtitle_files:
+            video_info = self.subtitle_to_video_map.get(subtitle_file)
+            if not video_info or video_info.get("fps"):
+                continue
+            video_path = video_info["path"]
+            if video_path in seen_paths:
+                continue
+            seen_paths.add(video_path)
+            pending.append((video_info, video_path))
+
+        if not pending or self._get_ffprobe_cmd() is False:
+            return
+
+        def probe(item):
+            video_info, video_path = item
+            fps = self.detect_video_framerate(video_path)
+            if fps:
+                video_info["fps"] = fps
+
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            list(executor.map(probe, pending))
+
     def position_window(self, window, x=None, y=None, parent=None, offset_x=0, offset_y=0):
         """
         Position a window at specific coordinates or centered, with optional offsets
@@ -494,64 +997,56 @@ class RapidMomentNavigator:
         Returns:
             The positioned window
         """
-        # Force the window to update and process all pending events
-        window.update()
-        
-        # Ensure window size is updated before calculating positions
+        # Flush pending geometry work so winfo_* reports real sizes. Only
+        # idle tasks are processed - a full update() here would run a second
+        # layout pass and re-enter arbitrary event handlers
         window.update_idletasks()
         
-        # Get window dimensions
+        # Get window dimensions - read each exactly once
         window_width = window.winfo_width()
         window_height = window.winfo_height()
         
-        # If window size is still 1x1, it's not properly initialized yet
-        # This can happen with newly created windows
+        # If the window still reports 1x1 it hasn't been laid out yet; trust
+        # the saved preference size instead of forcing a layout and
+        # re-querying Tk
         if window_width <= 1 or window_height <= 1:
-            self.debug_print(f"Window size not initialized yet: {window_width}x{window_height}, forcing geometry")
-            # Try to force the window to its requested size
+            self.debug_print("Window size not initialized yet: %sx%s, using saved size", window_width, window_height)
             if hasattr(window, '_w') and window._w == '.':  # Main window
-                # For main window, use the saved or default size
-                main_width, main_height = self.get_window_size("main_window")
-                window.geometry(f"{main_width}x{main_height}")
-                window_width = main_width
-                window_height = main_height
-            window.update_idletasks()
-            window_width = window.winfo_width()
-            window_height = window.winfo_height()
-            self.debug_print(f"After forcing geometry: {window_width}x{window_height}")
-        
-        # Store original values for debugging
-        orig_x, orig_y = x, y
+                window_width, window_height = self.get_window_size("main_window")
+                window.geometry(f"{window_width}x{window_height}")
         
         # Calculate X position independently
         if x is None:
             if parent is None:
-                # Center on screen horizontally
-                screen_width = window.winfo_screenwidth()
-                # x = (screen_width // 2) - (window_width // 2)
-                x = (screen_width - window_width) // 2
-                self.debug_print(f"Calculated X center: {x} = ({screen_width} - {window_width}) // 2")
+                # Center on screen horizontally (dimensions cached at init)
+                x = (self._screen_w - window_width) // 2
+                self.debug_print("Calculated X center: %s = (%s - %s) // 2", x, self._screen_w, window_width)
             else:
-                # Center relative to parent horizontally
-                parent_x = parent.winfo_x()
-                parent_width = parent.winfo_width()
+                # Center relative to parent horizontally, using the cached
+                # root geometry when the parent is the root window
+                if parent is self.root and self._root_geom is not None:
+                    parent_x, _, parent_width, _ = self._root_geom
+                else:
+                    parent_x = parent.winfo_x()
+                    parent_width = parent.winfo_width()
                 x = parent_x + (parent_width - window_width) // 2
-                self.debug_print(f"Calculated X center relative to parent: {x}")
+                self.debug_print("Calculated X center relative to parent: %s", x)
         
         # Calculate Y position independently
         if y is None:
             if parent is None:
-                # Center on screen vertically
-                screen_height = window.winfo_screenheight()
-                # y = (screen_height // 2) - (window_height // 2)
-                y = (screen_height - window_height) // 2
-                self.debug_print(f"Calculated Y center: {y} = ({screen_height} - {window_height}) // 2")
+                # Center on screen vertically (dimensions cached at init)
+                y = (self._screen_h - window_height) // 2
+                self.debug_print("Calculated Y center: %s = (%s - %s) // 2", y, self._screen_h, window_height)
             else:
                 # Center relative to parent vertically
-                parent_y = parent.winfo_y()
-                parent_height = parent.winfo_height()
+                if parent is self.root and self._root_geom is not None:
+                    _, parent_y, _, parent_height = self._root_geom
+                else:
+                    parent_y = parent.winfo_y()
+                    parent_height = parent.winfo_height()
                 y = parent_y + (parent_height - window_height) // 2
-                self.debug_print(f"Calculated Y center relative to parent: {y}")
+                self.debug_print("Calculated Y center relative to parent: %s", y)
         
         # Apply offsets
         x += offset_x
@@ -561,25 +1056,18 @@ class RapidMomentNavigator:
         x = max(0, x)
         y = max(0, y)
         
-        # Log screen dimensions if we calculated either position
-        if orig_x is None or orig_y is None:
-            if parent is None:
-                screen_width = window.winfo_screenwidth()
-                screen_height = window.winfo_screenheight()
-                self.debug_print(f"Screen dimensions: {screen_width}x{screen_height}")
-        
         # Set window position
         window.geometry(f"+{x}+{y}")
-        self.debug_print(f"Positioned window at ({x},{y}) with size {window_width}x{window_height}")
+        self.debug_print("Positioned window at (%s,%s) with size %sx%s", x, y, window_width, window_height)
         
-        # Force window to update again to ensure position takes effect
-        window.update_idletasks()
-        
-        # Verify final position
-        actual_x = window.winfo_x()
-        actual_y = window.winfo_y()
-        if actual_x != x or actual_y != y:
-            self.debug_print(f"Warning: Window position changed by window manager: ({x},{y}) → ({actual_x},{actual_y})")
+        # Verifying the final position costs an extra flush plus two winfo
+        # round trips, so only do it when debugging
+        if self.debug:
+            window.update_idletasks()
+            actual_x = window.winfo_x()
+            actual_y = window.winfo_y()
+            if actual_x != x or actual_y != y:
+                self.debug_print("Warning: Window position changed by window manager: (%s,%s) → (%s,%s)", x, y, actual_x, actual_y)
         
         return window
     
@@ -625,18 +1113,34 @@ class RapidMomentNavigator:
         except Exception as e:
             print(f"Error creating debug window: {e}", file=sys.stderr)
     
+    def _show_debug_window(self):
+        """Bring up the debug window, creating/building it on first use"""
+        self.ensure_debug_window()
+        if self.debug_window:
+            self.debug_window.show()
+
     def show_error_in_gui(self, title, message):
         """Display an error message in the GUI"""
+        _load_dialog_modules()
         # Update status bar
         first_line = message.split('\n')[0]
         self.status_var.set(f"Error: {first_line}")
         
-        # Show error dialog (in a separate thread to avoid blocking)
-        threading.Thread(target=lambda: messagebox.showerror(title, message)).start()
+        # Queue the dialog on the Tk event loop - messagebox isn't
+        # thread-safe, and after_idle is a queue append instead of spawning
+        # an OS thread per error
+        self.root.after_idle(messagebox.showerror, title, message)
+
+    def debug_print(self, message, *args):
+        """Print debug messages and add to debug window if available
 
-    def debug_print(self, message):
-        """Print debug messages and add to debug window if available"""
+        Extra args are applied with %-formatting only when debug is enabled,
+        so hot call sites can defer string building entirely:
+        self.debug_print("Importing %s", video_file)
+        """
         if self.debug:
+            if args:
+                message = message % args
             print(f"DEBUG: {message}", flush=True)
             
             # Only try to use the debug window if it's properly initialized
@@ -648,7 +1152,20 @@ class RapidMomentNavigator:
                 pass
     
     def _configure_scroll_region(self, event):
-        """Configure the scroll region of the canvas"""
+        """Schedule a scroll-region update, coalescing bursts of events.
+
+        This fires once per child added while results render, and
+        bbox("all") walks every canvas item - recomputing per event makes
+        rendering quadratic. Debouncing to one recompute per ~16ms frame
+        keeps it linear.
+        """
+        if self._scroll_region_after is not None:
+            self.root.after_cancel(self._scroll_region_after)
+        self._scroll_region_after = self.root.after(16, self._update_scroll_region)
+    
+    def _update_scroll_region(self):
+        """Recompute the canvas scroll region (debounced)"""
+        self._scroll_region_after = None
         self.results_canvas.configure(scrollregion=self.results_canvas.bbox("all"))
     
     def _configure_canvas_width(self, event):
@@ -658,130 +1175,105 @@ class RapidMomentNavigator:
     def _on_mousewheel(self, event):
         """Handle mousewheel scrolling with cross-platform support"""
         try:
-            # Determine scroll direction and amount based on platform
-            if hasattr(event, 'delta'):
-                # Windows and some Unix systems
-                scroll_amount = int(-1 * (event.delta / 120))
-            elif hasattr(event, 'num'):
-                # Mac and Linux (Button-4/Button-5 events)
-                scroll_amount = -1 if event.num == 4 else 1
-            else:
-                # Fallback
-                scroll_amount = -1 if event.type == '4' else 1
-            
-            self.results_canvas.yview_scroll(scroll_amount, "units")
+            self.results_canvas.yview_scroll(_scroll_amount(event), "units")
         except Exception as e:
             self.debug_print(f"Error in mousewheel handling: {e}")
 
     def _setup_canvas_scrolling(self, canvas):
         """Set up cross-platform scrolling for a canvas widget"""
-        import sys
-        
-        def on_scroll(event):
-            """Handle scroll events for the specific canvas"""
+        def on_scroll(amount):
+            """Apply a (possibly coalesced) wheel delta to this canvas"""
             try:
-                # Process scroll events with cross-platform support
-                
-                # Determine scroll direction and amount based on platform
-                if sys.platform == "darwin":  # macOS
-                    if hasattr(event, 'delta'):
-                        # macOS MouseWheel event - delta is small integers like 3, -3
-                        scroll_amount = -event.delta
-                    elif hasattr(event, 'num'):
-                        # macOS Button events - 4 is up, 5 is down (fallback)
-                        scroll_amount = -1 if event.num == 4 else 1
-                    else:
-                        # Fallback for macOS
-                        scroll_amount = -1
-                else:
-                    # Windows and Linux
-                    if hasattr(event, 'delta'):
-                        # Windows standard - delta is 120 per notch
-                        scroll_amount = int(-1 * (event.delta / 120))
-                    elif hasattr(event, 'num'):
-                        # Linux Button events
-                        scroll_amount = -1 if event.num == 4 else 1
-                    else:
-                        # Fallback
-                        scroll_amount = -1
-                
-                canvas.yview_scroll(scroll_amount, "units")
-                
+                canvas.yview_scroll(amount, "units")
             except Exception as e:
                 self.debug_print(f"Error in canvas scroll handling: {e}")
-                import traceback
-                self.debug_print(f"Traceback: {traceback.format_exc()}")
-        
+
         # Remove any existing bindings first
         canvas.unbind("<MouseWheel>")
         canvas.unbind("<Button-4>")
         canvas.unbind("<Button-5>")
-        
-        # Store the handler for this canvas  
+
+        # Store the handler directly on the canvas for the per-tick fetch;
+        # the dict only tracks which canvases are registered (cleanup and
+        # the router's any-active check)
+        canvas._scroll_handler = on_scroll
         self.active_scroll_canvases[canvas] = on_scroll
-        
-        # Note: Removed unreliable mouse enter/leave tracking
-        # Will use real-time position checking instead
-        
-        # Use simple window-based approach
-        # Since we have modal dialogs, only one scrollable area should be active at a time
-        def setup_global_handler():
-            """Set up a simple global scroll handler that routes to the appropriate canvas"""
-            if not hasattr(self, '_global_scroll_handler_installed'):
-                def simple_global_scroll_handler(event):
-                    """Simple global scroll handler based on which window should be active"""
-                    try:
-                        # Determine which canvas should receive scroll events
-                        # Priority order: settings dialogs > editor dialog > main canvas
-                        target_canvas = None
-                        
-                        # Highest priority: Window sizing dialog canvas
-                        if hasattr(self, 'window_sizing_canvas') and self.window_sizing_canvas:
-                            try:
-                                if self.window_sizing_canvas.winfo_exists():
-                                    target_canvas = self.window_sizing_canvas
-                                    self.debug_print("Routing scroll to window sizing canvas")
-                            except:
-                                pass
-                        
-                        # Second priority: Editor dialog canvas
-                        if not target_canvas and hasattr(self, 'editor_dialog') and self.editor_dialog and hasattr(self, 'editor_results_canvas'):
-                            try:
-                                if self.editor_results_canvas.winfo_exists():
-                                    target_canvas = self.editor_results_canvas
-                                    self.debug_print("Routing scroll to editor canvas")
-                            except:
-                                pass
-                        
-                        # Lowest priority: Main canvas
-                        if not target_canvas and hasattr(self, 'results_canvas'):
-                            try:
-                                if self.results_canvas.winfo_exists():
-                                    target_canvas = self.results_canvas
-                                    self.debug_print("Routing scroll to main canvas")
-                            except:
-                                pass
-                        
-                        # Execute scroll on target canvas
-                        if target_canvas and target_canvas in self.active_scroll_canvases:
-                            self.active_scroll_canvases[target_canvas](event)
-                            return "break"
-                                
-                    except Exception as e:
-                        self.debug_print(f"Error in simple global scroll handler: {e}")
-                
-                # Install the global handler once for all platforms
-                self.root.bind_all("<MouseWheel>", simple_global_scroll_handler)
-                
-                # Also bind Button events for Linux X11 compatibility
-                if sys.platform.startswith("linux"):
-                    self.root.bind_all("<Button-4>", simple_global_scroll_handler)
-                    self.root.bind_all("<Button-5>", simple_global_scroll_handler)
-                
-                self._global_scroll_handler_installed = True
-                self.debug_print("Installed simple global scroll handler for all platforms")
-        
-        setup_global_handler()
+
+    def _install_global_scroll_handler(self):
+        """Install the app-wide wheel binding that routes to the right canvas.
+
+        Called exactly once from __init__; registering a canvas afterwards
+        only needs a dict entry, not a fresh bind_all pass.
+        """
+        self.root.bind_all("<MouseWheel>", self._global_scroll_handler)
+
+        # Also bind Button events for Linux X11 compatibility
+        if sys.platform.startswith("linux"):
+            self.root.bind_all("<Button-4>", self._global_scroll_handler)
+            self.root.bind_all("<Button-5>", self._global_scroll_handler)
+
+        self.debug_print("Installed simple global scroll handler for all platforms")
+
+    def _global_scroll_handler(self, event):
+        """Route a wheel event to whichever scrollable canvas should be active"""
+        try:
+            # Nothing registered (startup, or every canvas cleaned up) -
+            # swallow the event rather than probing widgets for no reason
+            if not self.active_scroll_canvases:
+                return "break"
+
+            # Determine which canvas should receive scroll events
+            # Priority order: settings dialogs > editor dialog > main canvas
+            target_canvas = None
+
+            # Highest priority: Window sizing dialog canvas
+            if hasattr(self, 'window_sizing_canvas') and self.window_sizing_canvas:
+                try:
+                    if self.window_sizing_canvas.winfo_exists():
+                        target_canvas = self.window_sizing_canvas
+                except:
+                    pass
+
+            # Second priority: Editor dialog canvas
+            if target_canvas is None and self.editor_dialog and hasattr(self, 'editor_results_canvas'):
+                try:
+                    if self.editor_results_canvas.winfo_exists():
+                        target_canvas = self.editor_results_canvas
+                except:
+                    pass
+
+            # Lowest priority: Main canvas - always exists once the handler
+            # is installed, so no winfo_exists round-trip needed
+            if target_canvas is None:
+                target_canvas = self.results_canvas
+
+            # Accumulate the delta instead of scrolling per tick - fast
+            # trackpads emit event bursts, and one yview_scroll per idle
+            # cycle does the same motion with one layout pass
+            handler = getattr(target_canvas, '_scroll_handler', None)
+            if handler is not None:
+                if handler is not self._scroll_coalesce_handler and self._pending_scroll:
+                    self._flush_scroll()
+                self._scroll_coalesce_handler = handler
+                self._pending_scroll += _scroll_amount(event)
+                if not self._scroll_flush_scheduled:
+                    self._scroll_flush_scheduled = True
+                    self.root.after_idle(self._flush_scroll)
+
+        except Exception as e:
+            self.debug_print(f"Error in simple global scroll handler: {e}")
+
+        # Every exit swallows the event so it can't also reach default
+        # bindings and double-scroll
+        return "break"
+
+    def _flush_scroll(self):
+        """Apply the accumulated wheel delta in one yview_scroll call"""
+        self._scroll_flush_scheduled = False
+        amount = self._pending_scroll
+        self._pending_scroll = 0
+        if amount and self._scroll_coalesce_handler is not None:
+            self._scroll_coalesce_handler(amount)
 
     def _cleanup_canvas_scrolling(self, canvas):
         """Clean up scroll bindings for a canvas"""
@@ -789,6 +1281,7 @@ class RapidMomentNavigator:
             # Remove from active canvases
             if canvas in self.active_scroll_canvases:
                 del self.active_scroll_canvases[canvas]
+                canvas._scroll_handler = None
                 self.debug_print(f"Removed canvas from active scroll canvases ({len(self.active_scroll_canvases)} remaining)")
             
             # Note: No individual canvas events to unbind since we use global position checking
@@ -828,37 +1321,59 @@ class RapidMomentNavigator:
         if not directories:
             return []
             
-        # Normalize all paths first
-        normalized_dirs = [os.path.normpath(d) for d in directories]
-        
-        # Sort directories by path length (descending) to process most nested first
-        # This ensures we compare subdirectories against parent directories
-        sorted_dirs = sorted(normalized_dirs, key=len, reverse=True)
-        
-        # List to hold directories that aren't nested within others
+        # Normalize all paths first (dropping exact duplicates)
+        normalized_dirs = set(os.path.normpath(d) for d in directories)
+
+        # Sort by path components so every directory's descendants follow it
+        # as one contiguous block. Plain lexicographic order doesn't give
+        # that - characters sorting below os.sep can slot a stranger between
+        # a parent and its children
+        sorted_dirs = sorted(normalized_dirs, key=lambda d: d.split(os.sep))
+
+        # Single pass: a directory is nested iff it descends from the most
+        # recently kept one, since any closer ancestor would itself have
+        # been filtered as a descendant of that same kept directory. The
+        # kept prefix is built with its separator once, not per comparison
         filtered_dirs = []
-        
+        last_kept_prefix = None
+
         for dir_path in sorted_dirs:
-            # Check if this directory is contained within any directory we've already approved
-            is_nested = False
-            for approved_dir in filtered_dirs:
-                # Check if dir_path is a subdirectory of approved_dir
-                # dir_path starts with approved_dir followed by os separator
-                if dir_path.startswith(approved_dir + os.sep):
-                    is_nested = True
-                    break
-                    
-            # Add to filtered list if not nested
-            if not is_nested:
-                filtered_dirs.append(dir_path)
-        
+            if last_kept_prefix is not None and dir_path.startswith(last_kept_prefix):
+                continue
+            filtered_dirs.append(dir_path)
+            last_kept_prefix = dir_path + os.sep
+
         return filtered_dirs
             
+    def _scan_tree(self, root):
+        """Return (subtitle_files, video_files) for root, walking it once.
+
+        load_shows probes each candidate tree for SRT files and the mapping
+        pass walks the same tree again moments later; caching the single
+        traversal here lets both share it. The cache only lives for one load
+        generation - load_shows clears it up front - so it never serves
+        stale listings across refreshes.
+        """
+        key = os.path.normpath(root)
+        cached = self._walk_cache.get(key)
+        if cached is not None:
+            return cached
+        subtitle_files = []
+        video_files = []
+        for is_subtitle, path in _walk_media(root):
+            if is_subtitle:
+                subtitle_files.append(path)
+            else:
+                video_files.append(path)
+        self._walk_cache[key] = (subtitle_files, video_files)
+        return subtitle_files, video_files
+
     def load_shows(self):
         """Load the available shows from the directory structure"""
         shows_paths = []
         self.show_name_to_path_map.clear()  # Clear the mapping
-        
+        self._walk_cache.clear()  # New load generation - drop cached traversals
+
         # Get manually added directories from preferences
         manual_dirs = list(self.preferences.get("directories", []))
         self.debug_print(f"Load shows - manual directories from preferences: {manual_dirs}")
@@ -869,24 +1384,14 @@ class RapidMomentNavigator:
             self.debug_print(f"Load shows - filtered {len(manual_dirs) - len(filtered_manual_dirs)} nested manually added directories")
             self.debug_print(f"Load shows - using filtered manual directories: {filtered_manual_dirs}")
         
-        # Create a set of all manual directories and their subdirectories to exclude from current dir scanning
-        manual_dirs_and_subdirs = set()
-        for dir_path in filtered_manual_dirs:
-            if os.path.exists(dir_path) and os.path.isdir(dir_path):
-                # Add the directory itself
-                manual_dirs_and_subdirs.add(os.path.normpath(dir_path))
-                
-                # Add all subdirectories
-                try:
-                    for dirpath, dirnames, _ in os.walk(dir_path):
-                        for dirname in dirnames:
-                            subdir = os.path.normpath(os.path.join(dirpath, dirname))
-                            manual_dirs_and_subdirs.add(subdir)
-                except Exception as e:
-                    self.debug_print(f"Load shows - error scanning subdirectories of {dir_path}: {e}")
-        
-        self.debug_print(f"Load shows - found {len(manual_dirs_and_subdirs)} directories to exclude from current dir scanning")
-        
+        # Normalized manual roots (with their separator-suffixed prefixes
+        # built once), used by the current-dir probe below to skip children
+        # that live inside a manually added tree. A prefix test against
+        # these covers every subdirectory, so no recursive walk of the
+        # manual trees is needed to build an exclusion set
+        normalized_manual_dirs = [(os.path.normpath(d), os.path.normpath(d) + os.sep)
+                                  for d in filtered_manual_dirs]
+
         # Prepare search directories
         current_dir = self.get_current_directory()
         search_dirs = []
@@ -895,48 +1400,52 @@ class RapidMomentNavigator:
         if not self.preferences.get("exclude_current_dir", False):
             self.debug_print(f"Load shows - including current directory: {current_dir}")
             
-            # Get all immediate subdirectories in the current directory
+            # Get all immediate subdirectories in the current directory.
+            # scandir's DirEntry.is_dir reads the type bits returned by the
+            # directory listing itself, so this needs no per-entry stat call
             try:
-                current_dir_subdirs = [os.path.join(current_dir, d) for d in os.listdir(current_dir) 
-                                    if os.path.isdir(os.path.join(current_dir, d)) 
-                                    and not d.startswith('.') 
-                                    and d not in ['.git']]
+                with os.scandir(current_dir) as it:
+                    current_dir_subdirs = [entry.path for entry in it
+                                        if entry.is_dir(follow_symlinks=False)
+                                        and not entry.name.startswith('.')
+                                        and entry.name != '.git']
                 
                 self.debug_print(f"Load shows - found {len(current_dir_subdirs)} subdirectories in current directory")
                 
                 # For each subdirectory in current directory, check if it has subtitle files
                 for subdir in current_dir_subdirs:
-                    # Skip if this directory is in the manual_dirs_and_subdirs set
+                    # Skip if this directory is a manual directory or nested
+                    # inside one
                     normalized_subdir = os.path.normpath(subdir)
-                    if normalized_subdir in manual_dirs_and_subdirs:
-                        self.debug_print(f"Load shows - skipping {subdir} as it's already in manual directories")
+                    in_manual_dirs = False
+                    for normalized_manual, manual_prefix in normalized_manual_dirs:
+                        if (normalized_subdir == normalized_manual or
+                                normalized_subdir.startswith(manual_prefix)):
+                            in_manual_dirs = True
+                            self.debug_print(f"Load shows - skipping {subdir} as it's already in manual directories")
+                            break
+
+                    if in_manual_dirs:
                         continue
-                    
+
                     # Check if this is a parent directory of any manual directory
+                    subdir_prefix = normalized_subdir + os.sep
                     is_parent_of_manual = False
-                    for manual_dir in filtered_manual_dirs:
-                        normalized_manual = os.path.normpath(manual_dir)
-                        if normalized_manual.startswith(normalized_subdir + os.sep):
+                    for normalized_manual, _ in normalized_manual_dirs:
+                        if normalized_manual.startswith(subdir_prefix):
                             is_parent_of_manual = True
-                            self.debug_print(f"Load shows - skipping {subdir} as it's a parent of manual directory {manual_dir}")
+                            self.debug_print(f"Load shows - skipping {subdir} as it's a parent of manual directory {normalized_manual}")
                             break
-                    
+
                     if is_parent_of_manual:
                         continue
                     
-                    # Check if this subdirectory has any SRT files (anywhere in its tree)
-                    has_srt_files = False
-                    
+                    # Check if this subdirectory has any SRT files (anywhere
+                    # in its tree); the traversal is cached so the mapping
+                    # pass reuses it instead of walking the tree again
                     try:
-                        for dirpath, dirnames, filenames in os.walk(subdir):
-                            # Skip hidden directories
-                            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '.git']
-                            
-                            # Check if any SRT files exist in this directory
-                            if any(f.lower().endswith('.srt') for f in filenames):
-                                has_srt_files = True
-                                break
-                        
+                        has_srt_files = bool(self._scan_tree(subdir)[0])
+
                         if has_srt_files:
                             # This is a valid show directory
                             shows_paths.append(subdir)
@@ -987,27 +1496,16 @@ class RapidMomentNavigator:
         
         # Process each custom directory as a complete show
         for directory in search_dirs:
-            # Check if this directory has any SRT files
-            subtitle_files = []
-            
+            # Check if this directory has any SRT files; the cached traversal
+            # is shared with the mapping pass
             self.debug_print(f"Load shows - recursively scanning for SRT files in: {directory}")
-            
-            # Walk through all subdirectories to find SRT files
+
             try:
-                for dirpath, dirnames, filenames in os.walk(directory):
-                    # Skip hidden directories
-                    dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '.git']
-                    
-                    # Find all SRT files in this directory
-                    srt_files = [os.path.join(dirpath, f) for f in filenames if f.lower().endswith('.srt')]
-                    if srt_files:
-                        self.debug_print(f"Load shows - found {len(srt_files)} SRT files in: {dirpath}")
-                        subtitle_files.extend(srt_files)
-            
+                subtitle_files = self._scan_tree(directory)[0]
             except Exception as e:
                 self.debug_print(f"Load shows - error scanning directory {directory}: {e}")
                 continue
-            
+
             # If we found subtitle files, add this as a show
             if subtitle_files:
                 self.debug_print(f"Load shows - found total of {len(subtitle_files)} SRT files in {os.path.basename(directory)}")
@@ -1055,139 +1553,155 @@ class RapidMomentNavigator:
         # Clear previous mappings
         self.subtitle_to_video_map = {}
         
-        # Common video file extensions
-        video_extensions = ['.mp4', '.mkv', '.avi', '.mov', '.wmv', '.m4v', '.flv', '.webm', '.mp3', '.m4a', '.wav', '.aac', '.ogg']
-        
         # Get all show paths from the name-to-path mapping
         show_paths = list(self.show_name_to_path_map.values())
         
-        for show_path in show_paths:
-            show_name = os.path.basename(show_path)
-            
-            # Find all subtitle files (anywhere in the directory tree)
-            subtitle_files = []
-            # Find all video files (anywhere in the directory tree)
-            video_files = []
-            
-            self.debug_print(f"Mapping - scanning for subtitle and video files in: {show_path}")
-            
-            # Walk through all subdirectories
-            try:
-                for dirpath, dirnames, filenames in os.walk(show_path):
-                    # Skip hidden directories
-                    dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '.git']
-                    
-                    # Find all SRT files in this directory
-                    srt_files = [os.path.join(dirpath, f) for f in filenames if f.lower().endswith('.srt')]
-                    if srt_files:
-                        subtitle_files.extend(srt_files)
-                        
-                    # Find all video files in this directory
-                    video_files_here = [os.path.join(dirpath, f) for f in filenames 
-                                       if any(f.lower().endswith(ext) for ext in video_extensions)]
-                    if video_files_here:
-                        video_files.extend(video_files_here)
-            
-            except Exception as e:
-                self.debug_print(f"Mapping - error scanning directory {show_path}: {e}")
-                continue
-            
-            self.debug_print(f"Mapping - found {len(subtitle_files)} subtitle files and {len(video_files)} video files in {show_name}")
-            
-            # Map subtitles to videos based on similarity of filenames
-            for subtitle_file in subtitle_files:
-                subtitle_basename = os.path.basename(subtitle_file)
-                # Remove extension
-                subtitle_name = os.path.splitext(subtitle_basename)[0]
-                
-                # For SRT files that have .mp4.srt extension, extract true base name
-                if subtitle_name.endswith('.mp4'):
-                    subtitle_name = subtitle_name[:-4]  # Remove '.mp4'
-                
-                # Try exact matches first, then partial matches
-                matched = False
-                
-                # First pass: look for exact filename matches (without extensions)
-                for video_file in video_files:
+        # Each show's directory walk is independent and I/O-bound, so scan
+        # shows in parallel and merge the per-show maps back here
+        if len(show_paths) <= 1:
+            for show_path in show_paths:
+                self.subtitle_to_video_map.update(self._map_show_subtitles(show_path))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(show_paths))) as executor:
+                for show_map in executor.map(self._map_show_subtitles, show_paths):
+                    self.subtitle_to_video_map.update(show_map)
+        
+        self.debug_print(f"Mapping - completed. Mapped {len(self.subtitle_to_video_map)} subtitle files to videos")
+        self.status_var.set(f"Ready. Mapped {len(self.subtitle_to_video_map)} subtitle files to videos.")
+    
+    def _map_show_subtitles(self, show_path):
+        """Scan one show directory and return its subtitle-to-video map"""
+        show_name = os.path.basename(show_path)
+        show_map = {}
+
+        self.debug_print(f"Mapping - scanning for subtitle and video files in: {show_path}")
+
+        # Single traversal classifying both kinds at once, usually already
+        # cached by the load_shows probe of the same tree
+        try:
+            subtitle_files, video_files = self._scan_tree(show_path)
+
+        except Exception as e:
+            self.debug_print(f"Mapping - error scanning directory {show_path}: {e}")
+            return show_map
+        
+        self.debug_print(f"Mapping - found {len(subtitle_files)} subtitle files and {len(video_files)} video files in {show_name}")
+
+        # Clean each video name once up front; the partial-match pass below
+        # compares every subtitle against them, so cleaning inside that loop
+        # would redo the same regex work per subtitle
+        clean_videos = [(video_file,
+                         os.path.splitext(os.path.basename(video_file))[0],
+                         _clean_filename(os.path.splitext(os.path.basename(video_file))[0]))
+                        for video_file in video_files]
+
+        # Index videos by extensionless basename so the common exact-match
+        # case is a single dict lookup per subtitle. Built in reverse so the
+        # first video with a given name wins, like the old linear scan did
+        video_by_name = {video_name: video_file
+                         for video_file, video_name, _ in reversed(clean_videos)}
+
+        # Map subtitles to videos based on similarity of filenames
+        for subtitle_file in subtitle_files:
+            subtitle_basename = os.path.basename(subtitle_file)
+            # Remove extension
+            subtitle_name = os.path.splitext(subtitle_basename)[0]
+            
+            # For SRT files that have .mp4.srt extension, extract true base name
+            if subtitle_name.endswith('.mp4'):
+                subtitle_name = subtitle_name[:-4]  # Remove '.mp4'
+            
+            # Try exact matches first, then partial matches
+            matched = False
+
+            # First pass: exact filename match (without extensions) via the
+            # precomputed index
+            video_file = video_by_name.get(subtitle_name)
+            if video_file is not None:
+                # Store only the path - framerate will be detected when needed
+                show_map[subtitle_file] = {
+                    "path": video_file,
+                    "fps": None  # Initialize as None, will detect when needed
+                }
+                self.debug_print(f"Mapping - exact match: {subtitle_basename} -> {os.path.basename(video_file)}")
+                matched = True
+
+            # If no exact match, try partial matches
+            if not matched:
+                # Clean up filenames for better matching
+                clean_subtitle_name = _clean_filename(subtitle_name)
+
+                for video_file, video_name, clean_video_name in clean_videos:
                     video_basename = os.path.basename(video_file)
-                    video_name = os.path.splitext(video_basename)[0]
-                    
-                    if subtitle_name == video_name:
+
+                    # Check if the cleaned names match or one contains the other
+                    if (clean_subtitle_name == clean_video_name or
+                        clean_subtitle_name in clean_video_name or
+                        clean_video_name in clean_subtitle_name):
+                        
                         # Store only the path - framerate will be detected when needed
-                        self.subtitle_to_video_map[subtitle_file] = {
+                        show_map[subtitle_file] = {
                             "path": video_file,
                             "fps": None  # Initialize as None, will detect when needed
                         }
-                        self.debug_print(f"Mapping - exact match: {subtitle_basename} -> {video_basename}")
+                        self.debug_print(f"Mapping - partial match: {subtitle_basename} -> {video_basename}")
                         matched = True
                         break
-                
-                # If no exact match, try partial matches
-                if not matched:
-                    # Clean up filenames for better matching
-                    clean_subtitle_name = self._clean_filename(subtitle_name)
-                    
-                    for video_file in video_files:
-                        video_basename = os.path.basename(video_file)
-                        video_name = os.path.splitext(video_basename)[0]
-                        clean_video_name = self._clean_filename(video_name)
-                        
-                        # Check if the cleaned names match or one contains the other
-                        if (clean_subtitle_name == clean_video_name or
-                            clean_subtitle_name in clean_video_name or
-                            clean_video_name in clean_subtitle_name):
-                            
-                            # Store only the path - framerate will be detected when needed
-                            self.subtitle_to_video_map[subtitle_file] = {
-                                "path": video_file,
-                                "fps": None  # Initialize as None, will detect when needed
-                            }
-                            self.debug_print(f"Mapping - partial match: {subtitle_basename} -> {video_basename}")
-                            matched = True
-                            break
         
-        self.debug_print(f"Mapping - completed. Mapped {len(self.subtitle_to_video_map)} subtitle files to videos")
-        self.status_var.set(f"Ready. Mapped {len(self.subtitle_to_video_map)} subtitle files to videos.")
+        return show_map
     
+    def _get_ffprobe_cmd(self):
+        """Return the ffprobe command to run, discovering it once.
+
+        The old code ran "ffprobe -version" before every real probe - two
+        process spawns per video. The discovered command (or False when no
+        ffprobe exists) is cached for the life of the process.
+        """
+        if self._ffprobe_cmd is not None:
+            return self._ffprobe_cmd
+
+        try:
+            # First try ffprobe directly
+            cmd = ["ffprobe", "-version"]
+            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+                           creationflags=_NO_WINDOW_FLAG)
+            self._ffprobe_cmd = "ffprobe"
+        except (subprocess.SubprocessError, FileNotFoundError):
+            # If not available directly, try looking for it in common locations
+            ffprobe_locations = [
+                r"C:\Program Files\FFmpeg\bin\ffprobe.exe",
+                r"C:\Program Files (x86)\FFmpeg\bin\ffprobe.exe",
+                os.path.join(self.script_dir, "ffprobe.exe")
+            ]
+
+            self._ffprobe_cmd = False
+            for location in ffprobe_locations:
+                if os.path.exists(location):
+                    self._ffprobe_cmd = location
+                    break
+
+        return self._ffprobe_cmd
+
     def detect_video_framerate(self, video_path):
         """
         Detect the framerate of a video file using FFprobe.
-        
+
         Args:
             video_path (str): Path to the video file
-            
+
         Returns:
             float: Framerate of the video (defaults to 24.0 if detection fails)
         """
         try:
             # Get absolute path to the video file
             abs_video_path = self.get_absolute_path(video_path)
-            
+
             # Check if ffprobe is available
-            try:
-                # First try ffprobe directly
-                cmd = ["ffprobe", "-version"]
-                subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-                ffprobe_cmd = "ffprobe"
-            except (subprocess.SubprocessError, FileNotFoundError):
-                # If not available directly, try looking for it in common locations
-                ffprobe_locations = [
-                    r"C:\Program Files\FFmpeg\bin\ffprobe.exe",
-                    r"C:\Program Files (x86)\FFmpeg\bin\ffprobe.exe",
-                    os.path.join(self.script_dir, "ffprobe.exe")
-                ]
-                
-                ffprobe_found = False
-                for location in ffprobe_locations:
-                    if os.path.exists(location):
-                        ffprobe_cmd = location
-                        ffprobe_found = True
-                        break
-                    
-                if not ffprobe_found:
-                    self.debug_print("FFprobe not found, using default framerate")
-                    return 24.0
-            
+            ffprobe_cmd = self._get_ffprobe_cmd()
+            if ffprobe_cmd is False:
+                self.debug_print("FFprobe not found, using default framerate")
+                return 24.0
+
             # Construct the FFprobe command
             cmd = [
                 ffprobe_cmd,
@@ -1199,8 +1713,9 @@ class RapidMomentNavigator:
             ]
             
             # Run the command
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                    creationflags=_NO_WINDOW_FLAG)
+
             if result.returncode != 0:
                 self.debug_print(f"FFprobe error: {result.stderr}")
                 return 24.0
@@ -1364,22 +1879,6 @@ class RapidMomentNavigator:
             self.debug_print(f"Error detecting framerate from Resolve: {str(e)}")
             return self.detect_video_framerate(video_path)
     
-    def _clean_filename(self, filename):
-        """Clean a filename to improve matching chances"""
-        # Convert to lowercase
-        filename = filename.lower()
-        # Remove common separators
-        filename = filename.replace('_', ' ').replace('-', ' ').replace('.', ' ')
-        # Remove common words/patterns that might differ between subtitle and video filenames
-        remove_patterns = ['disc', 'season', 'title', 'episode', 's0', 'e0', 'x0']
-        for pattern in remove_patterns:
-            filename = filename.replace(pattern, '')
-        # Remove numbers that might be disc/episode numbers
-        filename = re.sub(r'\b\d{1,2}\b', '', filename)
-        # Remove extra spaces
-        filename = re.sub(r'\s+', ' ', filename).strip()
-        return filename
-    
     def search_subtitles(self, event=None):
         """Search for keywords in subtitle files"""
         keyword = self.search_var.get().strip()
@@ -1405,12 +1904,63 @@ class RapidMomentNavigator:
             widget.destroy()
         
         self.search_results = []
+        self._result_queue.clear()
+        self._results_rendered = 0
         
         self.debug_print(f"Searching for '{keyword}' in {selected_show_name} ({selected_show_path})")
         
         # Start search in a separate thread to keep UI responsive
         threading.Thread(target=self._search_thread, args=(keyword, selected_show_path)).start()
     
+    def _get_srt_entries(self, subtitle_file):
+        """Return the parsed entries of a subtitle file, cached by mtime.
+
+        Parsing is the CPU-bound part of a search; the subtitle library
+        rarely changes between searches, so entries are kept per file and
+        invalidated when the file's modification time moves.
+        """
+        st = _safe_stat(subtitle_file)
+        mtime_ns = st.st_mtime_ns if st is not None else None
+        cached = self._srt_parse_cache.get(subtitle_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        # Memory-map the file and decode straight from the mapped pages -
+        # one str allocation per file instead of a bytes buffer plus a str
+        with open(subtitle_file, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(memoryview(mm), 'utf-8', 'ignore')
+            except ValueError:
+                # Empty files cannot be mapped
+                content = ""
+
+        # Normalize line endings like text-mode reads used to - SRT files
+        # are typically CRLF, and _SRT_ENTRY_RE only matches \n
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        entries = []
+        for match in _SRT_ENTRY_RE.finditer(content):
+            text = match.group(4).strip()
+            
+            # Remove HTML tags and normalize
+            clean_text = _HTML_TAG_RE.sub('', text)
+            normalized_text = clean_text.replace('\u2028', ' ').replace('\u2029', ' ').replace('\n', ' ').replace('\r', ' ')
+            normalized_text = _WS_RE.sub(' ', normalized_text).strip()
+            
+            entries.append({
+                'num': match.group(1),
+                'start_time': match.group(2),
+                'end_time': match.group(3),
+                'text': text,
+                'clean_text': clean_text,
+                'normalized_text': normalized_text
+            })
+        
+        self._srt_parse_cache[subtitle_file] = (mtime_ns, entries)
+        return entries
+
     def _search_thread(self, keyword, selected_show_path):
         """Thread function to handle the search"""
         show_name = os.path.basename(selected_show_path)
@@ -1427,10 +1977,14 @@ class RapidMomentNavigator:
                 # Skip hidden directories
                 dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '.git']
                 
-                # Find all SRT files in this directory
-                srt_files = [os.path.join(dirpath, f) for f in filenames 
-                            if f.lower().endswith('.srt') or f.lower().endswith('.txt')]
-                
+                # Find all subtitle files in this directory - one set lookup
+                # per name, lowercasing the extension only when it isn't
+                # lowercase already
+                srt_files = [os.path.join(dirpath, f) for f in filenames
+                            if '.' in f and
+                            (ext if (ext := f.rpartition('.')[2]).islower() else ext.lower())
+                            in _SEARCH_SUB_EXTS]
+
                 if srt_files:
                     self.debug_print(f"Search - found {len(srt_files)} subtitle files in: {dirpath}")
                     subtitle_files.extend(srt_files)
@@ -1452,37 +2006,10 @@ class RapidMomentNavigator:
         # Process each subtitle file
         for subtitle_file in sorted(subtitle_files):
             file_results = []
-            all_entries = []  # Collect all entries for consecutive search
             
             try:
-                with open(subtitle_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # Parse SRT format and collect all entries
-                pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3})\s+-->\s+(\d{2}:\d{2}:\d{2},\d{3})\n((?:.+\n)+?)(?:\n|$)'
-                matches = re.finditer(pattern, content)
-                
-                # First pass: collect all entries
-                for match in matches:
-                    subtitle_num = match.group(1)
-                    start_time = match.group(2)
-                    end_time = match.group(3)
-                    text = match.group(4).strip()
-                    
-                    # Remove HTML tags and normalize
-                    clean_text = re.sub(r'<[^>]+>', '', text)
-                    normalized_text = clean_text.replace('\u2028', ' ').replace('\u2029', ' ').replace('\n', ' ').replace('\r', ' ')
-                    normalized_text = re.sub(r'\s+', ' ', normalized_text).strip()
-                    
-                    entry = {
-                        'num': subtitle_num,
-                        'start_time': start_time,
-                        'end_time': end_time,
-                        'text': text,
-                        'clean_text': clean_text,
-                        'normalized_text': normalized_text
-                    }
-                    all_entries.append(entry)
+                # First pass: parse the file (or reuse the cached entries)
+                all_entries = self._get_srt_entries(subtitle_file)
                 
                 # Second pass: individual search
                 for entry in all_entries:
@@ -1544,12 +2071,24 @@ class RapidMomentNavigator:
         # Update status
         self.debug_print(f"Found {total_results} matches in {show_name}")
         self.root.after(0, lambda: self.status_var.set(f"Found {total_results} matches in {show_name}"))
+
+        # Still on the worker thread: prewarm framerates for the first batch
+        # of result files so an import click right after the search doesn't
+        # have to wait on an ffprobe spawn
+        if total_results:
+            first_files = list(dict.fromkeys(
+                r['file'] for r in self.search_results[:_RESULT_RENDER_CHUNK]))
+            self._detect_framerates_bulk(first_files)
     
     def _update_results_ui(self, subtitle_file, file_results):
-        """Update the UI with search results (called from main thread)"""
-        # Add file header
-        file_basename = os.path.basename(subtitle_file)
-        
+        """Queue search results for rendering (called from main thread).
+
+        Only the first rows become real widgets immediately; the rest stay
+        as plain dicts in _result_queue and are materialized by
+        _render_more_results as the user scrolls toward them. Widget
+        creation is the dominant cost for large searches, so this caps it
+        at what the user actually looks at.
+        """
         # Find the show name this subtitle belongs to
         show_path = None
         for show_name, path in self.show_name_to_path_map.items():
@@ -1559,16 +2098,50 @@ class RapidMomentNavigator:
         
         # Get relative path from show root if possible
         if show_path:
-            relative_path = os.path.relpath(subtitle_file, show_path)
-            header_text = f"File: {relative_path}"
+            header_text = f"File: {os.path.relpath(subtitle_file, show_path)}"
         else:
-            header_text = f"File: {file_basename}"
+            header_text = f"File: {os.path.basename(subtitle_file)}"
+        
+        self._result_queue.append(("header", header_text))
+        for result in file_results:
+            self._result_queue.append(("result", result))
         
-        # Create a frame for the file header
+        # Keep roughly a chunk's worth of rows rendered eagerly so the first
+        # screenful appears without scrolling
+        if self._results_rendered < _RESULT_RENDER_CHUNK:
+            self._render_more_results()
+    
+    def _on_results_scroll(self, first, last):
+        """yscrollcommand hook: update the scrollbar and render queued rows
+        when the view nears the bottom (or everything fits on screen)"""
+        self.results_scrollbar.set(first, last)
+        if self._result_queue and float(last) > 0.9 and not self._result_render_scheduled:
+            # Deferred to idle time - rendering from inside a scroll callback
+            # would recurse through the scrollregion update
+            self._result_render_scheduled = True
+            self.root.after_idle(self._render_more_results)
+    
+    def _render_more_results(self):
+        """Materialize up to one chunk of queued result rows into widgets"""
+        self._result_render_scheduled = False
+        rendered = 0
+        while self._result_queue and rendered < _RESULT_RENDER_CHUNK:
+            kind, payload = self._result_queue.popleft()
+            if kind == "header":
+                self._render_file_header(payload)
+            else:
+                self._render_result_row(payload)
+            rendered += 1
+        self._results_rendered += rendered
+        if rendered:
+            self.debug_print("Rendered %d result rows (%d still queued)",
+                             rendered, len(self._result_queue))
+    
+    def _render_file_header(self, header_text):
+        """Create the widgets for one file-header row"""
         header_frame = ttk.Frame(self.results_container)
         header_frame.pack(fill="x", padx=5, pady=2)
         
-        # Add file header label
         file_header = ttk.Label(
             header_frame, 
             text=header_text, 
@@ -1576,74 +2149,65 @@ class RapidMomentNavigator:
             foreground="green"
         )
         file_header.pack(side="left", anchor="w")
-        
+    
+    def _render_result_row(self, result):
+        """Create the widgets for one search-result row"""
         # Check if we should show import buttons
-        selected_editor = self.editor_var.get()
-        show_import_buttons = selected_editor != "None"
+        show_import_buttons = self.editor_var.get() != "None"
+        
+        # Create a frame for this result
+        result_frame = ttk.Frame(self.results_container)
+        result_frame.pack(fill="x", padx=5, pady=2, anchor="w")
+        
+        # Create import buttons frame at the top right
+        import_buttons_frame = ttk.Frame(result_frame)
+        # Store reference to the import buttons frame for later visibility updates
+        result_frame.import_buttons_frame = import_buttons_frame
+        
+        # Always create the import buttons, but only show the frame if editor is selected
+        if show_import_buttons:
+            import_buttons_frame.pack(side="right", padx=5, anchor="ne")
+        
+        # Add Import Media button (always create, will be visible only if frame is visible)
+        import_media_btn = ClickableImport(
+            import_buttons_frame, 
+            "Import Media", 
+            result, 
+            self._handle_import_media_click,
+            tooltip="Import the entire video file to the DaVinci Resolve timeline"
+        )
+        import_media_btn.pack(side="left", padx=5)
+        
+        # Add Import Clip button (always create, will be visible only if frame is visible)
+        import_clip_btn = ClickableImport(
+            import_buttons_frame, 
+            "Import Clip", 
+            result, 
+            self._handle_import_clip_click,
+            tooltip="Import only the time range from this subtitle entry to the DaVinci Resolve timeline"
+        )
+        import_clip_btn.pack(side="left", padx=5)
+        
+        # Create content frame (with timecode and text) that fills the remaining space
+        content_frame = ttk.Frame(result_frame)
+        content_frame.pack(side="left", fill="both", expand=True, anchor="w")
+        
+        # Create clickable timecode label
+        timecode_text = f"{result['start_time']} --> {result['end_time']}"
+        timecode_label = ClickableTimecode(
+            content_frame, 
+            timecode_text, 
+            result, 
+            self._handle_timecode_click
+        )
+        timecode_label.pack(anchor="w")
         
-        # Add each result
-        for result in file_results:
-            # Create a frame for this result
-            result_frame = ttk.Frame(self.results_container)
-            result_frame.pack(fill="x", padx=5, pady=2, anchor="w")
-            
-            # Create import buttons frame at the top right
-            import_buttons_frame = ttk.Frame(result_frame)
-            # Store reference to the import buttons frame for later visibility updates
-            result_frame.import_buttons_frame = import_buttons_frame
-            
-            # Always create the import buttons, but only show the frame if editor is selected
-            if show_import_buttons:
-                import_buttons_frame.pack(side="right", padx=5, anchor="ne")
-            
-            # Add Import Media button (always create, will be visible only if frame is visible)
-            import_media_btn = ClickableImport(
-                import_buttons_frame, 
-                "Import Media", 
-                result, 
-                self._handle_import_media_click,
-                tooltip="Import the entire video file to the DaVinci Resolve timeline"
-            )
-            import_media_btn.pack(side="left", padx=5)
-            
-            # Add Import Clip button (always create, will be visible only if frame is visible)
-            import_clip_btn = ClickableImport(
-                import_buttons_frame, 
-                "Import Clip", 
-                result, 
-                self._handle_import_clip_click,
-                tooltip="Import only the time range from this subtitle entry to the DaVinci Resolve timeline"
-            )
-            import_clip_btn.pack(side="left", padx=5)
-            
-            # Create content frame (with timecode and text) that fills the remaining space
-            content_frame = ttk.Frame(result_frame)
-            content_frame.pack(side="left", fill="both", expand=True, anchor="w")
-            
-            # Create clickable timecode label
-            timecode_text = f"{result['start_time']} --> {result['end_time']}"
-            timecode_label = ClickableTimecode(
-                content_frame, 
-                timecode_text, 
-                result, 
-                self._handle_timecode_click
-            )
-            timecode_label.pack(anchor="w")
-            
-            # Add text label
-            subtitle_label = ttk.Label(content_frame, text=result['clean_text'], wraplength=700)
-            subtitle_label.pack(anchor="w", padx=10)
-            
-            # Debug output to compare text formatting
-            self.debug_print(f"MAIN SEARCH - Original text: {repr(result['text'])}")
-            self.debug_print(f"MAIN SEARCH - Clean text: {repr(result['clean_text'])}")
-            
-            # Add some space after each result
-            ttk.Separator(self.results_container, orient="horizontal").pack(fill="x", pady=5)
-            
-            self.debug_print(f"Added clickable timecode for {timecode_text}")
+        # Add text label
+        subtitle_label = ttk.Label(content_frame, text=result['clean_text'], wraplength=700)
+        subtitle_label.pack(anchor="w", padx=10)
         
-        self.debug_print(f"UI updated with {len(file_results)} results from {file_basename}")
+        # Add some space after each result
+        ttk.Separator(self.results_container, orient="horizontal").pack(fill="x", pady=5)
     
     def _restore_subtitle_line_breaks(self, text):
         """Restore line breaks in subtitle text from DaVinci Resolve API"""
@@ -1658,7 +2222,7 @@ class RapidMomentNavigator:
         text = text.replace('\u2029', '\n')
         
         # Clean up any potential double spaces
-        text = re.sub(r'  +', ' ', text)
+        text = _MULTISPACE_RE.sub(' ', text)
         
         # Limit to 2 lines maximum to prevent overly tall results
         lines = text.split('\n')
@@ -1670,84 +2234,81 @@ class RapidMomentNavigator:
     def _handle_timecode_click(self, result):
         """Process a click on a timecode tag"""
         subtitle_file = result['file']
-        self.debug_print(f"Handling click for subtitle file: {subtitle_file}")
-        
+        self.debug_print("Handling click for subtitle file: %s", subtitle_file)
+
         if subtitle_file in self.subtitle_to_video_map:
             video_info = self.subtitle_to_video_map[subtitle_file]
             video_file = video_info["path"]
-            self.debug_print(f"Found matching video file: {video_file}")
+            self.debug_print("Found matching video file: %s", video_file)
             self.play_video(video_file, result['mpc_start_time'])
             self.status_var.set(f"Opening {os.path.basename(video_file)} at {result['mpc_start_time']}")
         else:
-            self.debug_print(f"No matching video file found for {os.path.basename(subtitle_file)}")
-            self.status_var.set(f"No matching video file found for {os.path.basename(subtitle_file)}")
+            subtitle_name = os.path.basename(subtitle_file)
+            self.debug_print("No matching video file found for %s", subtitle_name)
+            self.status_var.set(f"No matching video file found for {subtitle_name}")
     
     def get_absolute_path(self, relative_path):
         """Convert a relative path to an absolute path based on script directory"""
         abs_path = os.path.normpath(os.path.join(self.script_dir, relative_path))
-        self.debug_print(f"Converting relative path: {relative_path} to absolute: {abs_path}")
+        self.debug_print("Converting relative path: %s to absolute: %s", relative_path, abs_path)
         return abs_path
     
     def play_video(self, video_file, start_time):
         """Launch Media Player Classic with the video at the specified time"""
+        # Convert the relative video path to absolute
+        abs_video_path = self.get_absolute_path(video_file)
+
+        # Construct the command for MPC-HC
+        # Documentation says correct parameter is /startpos hh:mm:ss
+        mpc_path = "C:\\Program Files\\MPC-HC\\mpc-hc64.exe"
+
+        # Check if default MPC path exists
+        if not os.path.exists(mpc_path):
+            # Try alternative paths
+            alternative_paths = [
+                "C:\\Program Files (x86)\\MPC-HC\\mpc-hc.exe",
+                "C:\\Program Files (x86)\\K-Lite Codec Pack\\MPC-HC64\\mpc-hc64.exe",
+                "C:\\Program Files\\K-Lite Codec Pack\\MPC-HC64\\mpc-hc64.exe"
+            ]
+
+            for path in alternative_paths:
+                if os.path.exists(path):
+                    mpc_path = path
+                    break
+
+        self.debug_print("Using MPC path: %s", mpc_path)
+
+        # Ordered launch strategies - first success wins. A flat loop keeps
+        # the common case (MPC launches directly) to a single dispatch
+        # instead of nesting exception handlers three levels deep.
+        strategies = (
+            # /startpos as a separate parameter
+            lambda: subprocess.Popen([mpc_path, abs_video_path, "/startpos", start_time], **PLAYER_POPEN_KWARGS),
+            # shell=True with space-separated arguments
+            lambda: subprocess.Popen(f'start "" "{mpc_path}" "{abs_video_path}" /startpos {start_time}',
+                                     shell=True, **PLAYER_POPEN_KWARGS),
+            # shell=True with parameter combined with value
+            lambda: subprocess.Popen(f'start "" "{mpc_path}" "{abs_video_path}" /startpos={start_time}',
+                                     shell=True, **PLAYER_POPEN_KWARGS),
+        )
+
+        last_error = None
+        for strategy in strategies:
+            try:
+                strategy()
+                return
+            except Exception as e:
+                self.debug_print("Launch strategy failed: %s", e)
+                last_error = e
+
+        # Fall back to default player if all MPC launch methods fail
+        self.debug_print("Error with all launch methods, falling back to default player")
         try:
-            # Convert the relative video path to absolute
-            abs_video_path = self.get_absolute_path(video_file)
-            
-            # Construct the command for MPC-HC
-            # Documentation says correct parameter is /startpos hh:mm:ss
-            mpc_path = "C:\\Program Files\\MPC-HC\\mpc-hc64.exe"
-            
-            # Check if default MPC path exists
-            if not os.path.exists(mpc_path):
-                # Try alternative paths
-                alternative_paths = [
-                    "C:\\Program Files (x86)\\MPC-HC\\mpc-hc.exe",
-                    "C:\\Program Files (x86)\\K-Lite Codec Pack\\MPC-HC64\\mpc-hc64.exe",
-                    "C:\\Program Files\\K-Lite Codec Pack\\MPC-HC64\\mpc-hc64.exe"
-                ]
-                
-                for path in alternative_paths:
-                    if os.path.exists(path):
-                        mpc_path = path
-                        break
-                        
-            self.debug_print(f"Using MPC path: {mpc_path}")
-            
-            # Try method 1: Using /startpos as a separate parameter
-            command = [mpc_path, abs_video_path, "/startpos", start_time]
-            self.debug_print(f"Executing command: {command}")
-            subprocess.Popen(command)
-            
+            os.startfile(abs_video_path)
+            self.status_var.set(f"Opened {os.path.basename(video_file)} with default player")
         except Exception as e:
-            self.debug_print(f"Error launching Media Player Classic: {str(e)}")
-            self.status_var.set(f"Error launching Media Player Classic: {e}")
-            
-            try:
-                # Try method 2: Using shell=True with space-separated arguments
-                self.debug_print("Trying alternate launch method with shell=True")
-                abs_video_path = self.get_absolute_path(video_file)
-                command = f'start "" "{mpc_path}" "{abs_video_path}" /startpos {start_time}'
-                self.debug_print(f"Shell command: {command}")
-                subprocess.Popen(command, shell=True)
-            except Exception as e2:
-                try:
-                    # Try method 3: Using shell=True with parameter combined with value
-                    self.debug_print("Trying another alternative launch method")
-                    command = f'start "" "{mpc_path}" "{abs_video_path}" /startpos={start_time}'
-                    self.debug_print(f"Shell command: {command}")
-                    subprocess.Popen(command, shell=True)
-                except Exception as e3:
-                    self.debug_print(f"Error with all launch methods, falling back to default player")
-                    
-                    # Fall back to default player if MPC fails
-                    try:
-                        abs_video_path = self.get_absolute_path(video_file)
-                        os.startfile(abs_video_path)
-                        self.status_var.set(f"Opened {os.path.basename(video_file)} with default player")
-                    except Exception as e4:
-                        self.debug_print(f"Error opening with default player: {str(e4)}")
-                        self.status_var.set(f"Error opening video: {e4}")
+            self.debug_print(f"Error opening with default player: {str(e)}")
+            self.status_var.set(f"Error opening video: {e}")
 
     def _ctrl_backspace_handler(self, event):
         """Handle Ctrl+Backspace to delete the word to the left of cursor"""
@@ -1763,18 +2324,10 @@ class RapidMomentNavigator:
         # Get the current text
         text = entry_widget.get()
         
-        # Find the start of the current word
-        word_start = current_pos - 1
-        
-        # Skip spaces if we're in a space region
-        while word_start >= 0 and text[word_start] == ' ':
-            word_start -= 1
-            
-        # Find the beginning of the word
-        while word_start >= 0 and text[word_start] != ' ':
-            word_start -= 1
-        
-        word_start += 1  # Move past the space or to position 0
+        # Locate the last word (plus any trailing spaces) before the cursor
+        # in one C-level scan; all-space input deletes back to the start
+        m = _LAST_WORD_RE.search(text, 0, current_pos)
+        word_start = m.start() if m else 0
         
         # Delete directly using widget methods (more reliable than manipulating StringVar)
         entry_widget.delete(word_start, current_pos)
@@ -1797,6 +2350,9 @@ class RapidMomentNavigator:
         self.preferences["selected_editor"] = selected_editor
         self.save_preferences()
         
+        # Re-resolve the dispatch table for the new selection
+        self._rebuild_editor_dispatch(selected_editor)
+        
         # Update import buttons visibility
         self._update_import_buttons_visibility()
         
@@ -1833,31 +2389,35 @@ class RapidMomentNavigator:
         start_time = result['start_time']
         end_time = result['end_time']
         
-        self.debug_print(f"🎬 Import Media clicked for: {subtitle_file}")
-        self.debug_print(f"   Time range: {start_time} to {end_time}")
-        
+        self.debug_print("🎬 Import Media clicked for: %s", subtitle_file)
+        self.debug_print("   Time range: %s to %s", start_time, end_time)
+
         # Check if subtitle file exists in mapping
         if subtitle_file not in self.subtitle_to_video_map:
-            self.debug_print(f"❌ Video file not found for subtitle: {subtitle_file}")
+            self.debug_print("❌ Video file not found for subtitle: %s", subtitle_file)
             return
-            
+
+        # Read the editor selection once per click - each editor_var.get() is
+        # a Tcl round-trip, so thread the cached name through the dispatchers
+        selected_editor = self.editor_var.get()
+
         # Generic editor handling - no more hardcoded checks!
-        if not self._ensure_editor_ready():
+        if not self._ensure_editor_ready(selected_editor):
             self.debug_print("❌ Editor not ready for import")
             return
-            
+
         try:
             # Detect framerate using editor-specific method
-            fps = self._detect_framerate_for_editor(subtitle_file)
-            self.debug_print(f"🎞️ Detected framerate: {fps} fps")
-            
+            fps = self._detect_framerate_for_editor(subtitle_file, selected_editor)
+            self.debug_print("🎞️ Detected framerate: %s fps", fps)
+
             # Store the detected framerate in the video info cache for use by import methods
             if fps and subtitle_file in self.subtitle_to_video_map:
                 self.subtitle_to_video_map[subtitle_file]["fps"] = fps
-                self.debug_print(f"📝 Cached framerate {fps} fps for {subtitle_file}")
+                self.debug_print("📝 Cached framerate %s fps for %s", fps, subtitle_file)
             
             # Import using generic method that dispatches to editor-specific implementation
-            self._import_media_to_editor(subtitle_file, start_time, end_time)
+            self._import_media_to_editor(subtitle_file, start_time, end_time, selected_editor)
             
         except Exception as e:
             self.debug_print(f"❌ Error during media import: {e}")
@@ -1869,23 +2429,26 @@ class RapidMomentNavigator:
         start_time = result['start_time'] 
         end_time = result['end_time']
         
-        self.debug_print(f"✂️ Import Clip clicked for: {subtitle_file}")
-        self.debug_print(f"   Time range: {start_time} to {end_time}")
-        
+        self.debug_print("✂️ Import Clip clicked for: %s", subtitle_file)
+        self.debug_print("   Time range: %s to %s", start_time, end_time)
+
         # Check if subtitle file exists in mapping
         if subtitle_file not in self.subtitle_to_video_map:
-            self.debug_print(f"❌ Video file not found for subtitle: {subtitle_file}")
+            self.debug_print("❌ Video file not found for subtitle: %s", subtitle_file)
             return
-            
+
+        # Read the editor selection once per click and reuse it below
+        selected_editor = self.editor_var.get()
+
         # Generic editor handling - no more hardcoded checks!
-        if not self._ensure_editor_ready():
+        if not self._ensure_editor_ready(selected_editor):
             self.debug_print("❌ Editor not ready for import")
             return
-            
+
         try:
             # Import using generic method that dispatches to editor-specific implementation
             # Framerate detection now happens directly during import - no separate detection needed!
-            self._import_clip_to_editor(subtitle_file, start_time, end_time)
+            self._import_clip_to_editor(subtitle_file, start_time, end_time, selected_editor)
             
         except Exception as e:
             self.debug_print(f"❌ Error during clip import: {e}")
@@ -1911,15 +2474,19 @@ class RapidMomentNavigator:
             if not hasattr(self, 'resolve_in_safe_mode') or not hasattr(self, 'resolve_initialized'):
                 self.resolve_in_safe_mode = False
                 self.resolve_initialized = False
-            
-            # Don't attempt to use the API if we're in safe mode
+
+            # Don't attempt to use the API if we're in safe mode - cheap early
+            # return, and only build the error dialog the first time so
+            # hammered clicks don't keep spawning dialogs
             if self.resolve_in_safe_mode:
                 self.debug_print("Resolve is in safe mode - import functionality disabled")
                 self.status_var.set("Cannot import: DaVinci Resolve integration is in safe mode")
-                self.show_error_in_gui("DaVinci Resolve Safe Mode", 
-                                     "The integration is running in safe mode due to initialization errors.\n\n"
-                                     "Import functionality is disabled to prevent crashes.\n\n"
-                                     "Please check that DaVinci Resolve is properly installed and running.")
+                if not self._resolve_safe_mode_notified:
+                    self._resolve_safe_mode_notified = True
+                    self.show_error_in_gui("DaVinci Resolve Safe Mode",
+                                         "The integration is running in safe mode due to initialization errors.\n\n"
+                                         "Import functionality is disabled to prevent crashes.\n\n"
+                                         "Please check that DaVinci Resolve is properly installed and running.")
                 return False
             
             # Check if API is initialized, if not initialize it now
@@ -1988,17 +2555,18 @@ class RapidMomentNavigator:
             
         video_info = self.subtitle_to_video_map[subtitle_file]
         video_file = video_info["path"]
-        
+        video_name = os.path.basename(video_file)
+
         try:
             # Get absolute path to the video file
             abs_video_path = self.get_absolute_path(video_file)
-            
+
             # Call the timeline import function without time range parameters for full media
             success = self.import_clip_to_timeline(abs_video_path)
-            
+
             if success:
                 self.debug_print(f"✅ Successfully imported full media to DaVinci Resolve timeline")
-                self.status_var.set(f"Media {os.path.basename(video_file)} imported to DaVinci Resolve")
+                self.status_var.set(f"Media {video_name} imported to DaVinci Resolve")
             else:
                 self.debug_print("❌ Failed to import media to DaVinci Resolve timeline")
                 self.status_var.set("Failed to import media to DaVinci Resolve timeline")
@@ -2022,55 +2590,16 @@ class RapidMomentNavigator:
         self.debug_print(f"API path for subprocess test: {api_path}")
         self.debug_print(f"LIB path for subprocess test: {lib_path}")
         
-        # Create a temporary Python file with the import test using our WORKING approach
-        with tempfile.NamedTemporaryFile(suffix='.py', delete=False, mode='w', encoding='utf-8') as f:
-            test_script = f.name
-            
-            # Write a script using the SAME LOGIC that works in our main method
-            f.write(f'''
-import os
-import sys
-
-# Set required environment variables
-os.environ["RESOLVE_SCRIPT_API"] = r"{api_path}"
-os.environ["RESOLVE_SCRIPT_LIB"] = r"{lib_path}"
-
-print(f"Test subprocess - API path: {api_path}")
-print(f"Test subprocess - LIB path: {lib_path}")
-
-# Use the SAME simplified approach that works in the main method
-if r"{api_path}" and os.path.exists(r"{api_path}"):
-    if r"{api_path}" not in sys.path:
-        sys.path.append(r"{api_path}")
-        print(f"Added API path to Python path: {api_path}")
-    
-    # CRITICAL: Also add the Modules subdirectory (this was the key fix!)
-    modules_path = os.path.join(r"{api_path}", "Modules")
-    if os.path.exists(modules_path) and modules_path not in sys.path:
-        sys.path.append(modules_path)
-        print(f"Added Modules path to Python path: {{modules_path}}")
-
-print(f"Final sys.path: {{sys.path}}")
+        # Fill in the module-level probe template (same logic that works in
+        # our main method) and pass it inline via -c
+        test_code = _RESOLVE_PROBE_TEMPLATE.format(api_path=api_path, lib_path=lib_path)
 
-# Try the import
-try:
-    import DaVinciResolveScript
-    print("SUCCESS: DaVinciResolveScript imported successfully in subprocess")
-    sys.exit(0)
-except ImportError as e:
-    print(f"FAILED: Import error in subprocess: {{e}}")
-    sys.exit(1)
-except Exception as e:
-    print(f"FAILED: Unexpected error in subprocess: {{e}}")
-    sys.exit(1)
-''')
-        
         try:
-            # Run the test script in a separate process
-            self.debug_print(f"Running import test script: {test_script}")
+            # Run the probe inline in a separate process
+            self.debug_print("Running import test via -c probe")
             result = subprocess.run(
-                [sys.executable, test_script],
-                capture_output=True, 
+                [sys.executable, "-c", test_code],
+                capture_output=True,
                 text=True,
                 timeout=10  # Set a timeout to avoid hanging
             )
@@ -2092,12 +2621,6 @@ except Exception as e:
         except Exception as e:
             self.debug_print(f"Error running import test: {e}")
             return False
-        finally:
-            # Clean up the temporary file
-            try:
-                os.unlink(test_script)
-            except:
-                pass
 
     def import_clip_to_timeline(self, clip_path, start_tc=None, end_tc=None, start_frame=None, end_frame=None, fps=24.0):
         """
@@ -2116,47 +2639,62 @@ except Exception as e:
         """
         global dvr_script
         try:
-            self.debug_print(f"Importing clip: {clip_path}")
-            
+            self.debug_print("Importing clip: %s", clip_path)
+
             # Get Resolve
             resolve = dvr_script.scriptapp("Resolve")
             if not resolve:
                 self.debug_print("Failed to get Resolve object")
                 return False
-            
-            # Get project manager
-            project_manager = resolve.GetProjectManager()
-            if not project_manager:
-                self.debug_print("Failed to get project manager")
-                return False
-            
-            # Get current project
-            project = project_manager.GetCurrentProject()
+
+            # Get current project (cached - GetProjectManager/GetCurrentProject
+            # are scripting-bridge round-trips we only need on first use)
+            project = self._resolve_cache.get("project")
             if not project:
-                self.debug_print("No project is currently open")
-                return False
-            
-            self.debug_print(f"Current project: {project.GetName()}")
-            
-            # Make sure we're on the Edit page
-            current_page = resolve.GetCurrentPage()
-            if current_page != "edit":
-                resolve.OpenPage("edit")
-                time.sleep(0.5)
-            
-            # Get media pool
-            media_pool = project.GetMediaPool()
+                project_manager = resolve.GetProjectManager()
+                if not project_manager:
+                    self.debug_print("Failed to get project manager")
+                    return False
+
+                project = project_manager.GetCurrentProject()
+                if not project:
+                    self.debug_print("No project is currently open")
+                    return False
+
+                self._resolve_cache["project"] = project
+                self.debug_print("Current project: %s", project.GetName())
+
+            # Make sure we're on the Edit page - skip the GetCurrentPage
+            # round-trip once we know we're already there
+            if self._resolve_last_page != "edit":
+                current_page = resolve.GetCurrentPage()
+                if current_page != "edit":
+                    resolve.OpenPage("edit")
+                    # Poll instead of a fixed half-second sleep so fast
+                    # machines continue as soon as the page switch lands
+                    deadline = time.time() + 0.5
+                    while resolve.GetCurrentPage() != "edit" and time.time() < deadline:
+                        time.sleep(0.05)
+                self._resolve_last_page = "edit"
+
+            # Get media pool (cached alongside the project handle)
+            media_pool = self._resolve_cache.get("media_pool")
             if not media_pool:
-                self.debug_print("Failed to get media pool")
-                return False
-            
-            # Get current timeline
-            timeline = project.GetCurrentTimeline()
+                media_pool = project.GetMediaPool()
+                if not media_pool:
+                    self.debug_print("Failed to get media pool")
+                    return False
+                self._resolve_cache["media_pool"] = media_pool
+
+            # Get current timeline (cached)
+            timeline = self._resolve_cache.get("timeline")
             if not timeline:
-                self.debug_print("No timeline is currently open")
-                return False
-            
-            self.debug_print(f"Current timeline: {timeline.GetName()}")
+                timeline = project.GetCurrentTimeline()
+                if not timeline:
+                    self.debug_print("No timeline is currently open")
+                    return False
+                self._resolve_cache["timeline"] = timeline
+                self.debug_print("Current timeline: %s", timeline.GetName())
             
             # Normalize path
             abs_path = os.path.abspath(clip_path)
@@ -2207,9 +2745,13 @@ except Exception as e:
                 duration_seconds = duration_frames / detected_fps
                 self.debug_print(f"Clip duration: {duration_frames} frames ({duration_seconds:.2f} seconds)")
             
-            # Get current project framerate for comparison
+            # Get current project framerate for comparison (cached - the
+            # GetSetting round-trip only needs to happen once per project)
             try:
-                project_fps_str = project.GetSetting("timelineFrameRate")
+                project_fps_str = self._resolve_cache.get("project_fps")
+                if not project_fps_str:
+                    project_fps_str = project.GetSetting("timelineFrameRate")
+                    self._resolve_cache["project_fps"] = project_fps_str
                 if project_fps_str:
                     # Remove "DF" if present
                     if ' ' in project_fps_str:
@@ -2268,11 +2810,19 @@ except Exception as e:
                 
             self.debug_print("Failed to append clip to timeline")
             return False
-                
+
         except Exception as e:
             self.debug_print(f"Error importing clip: {e}")
+            # Cached handles may be stale (project/timeline closed) - drop
+            # them so the next import re-fetches everything
+            self._invalidate_resolve_cache()
             return False
-        
+
+    def _invalidate_resolve_cache(self):
+        """Drop cached Resolve object handles so the next import re-fetches them"""
+        self._resolve_cache = {"project": None, "project_fps": None, "media_pool": None, "timeline": None}
+        self._resolve_last_page = None
+
     def timecode_to_frames(self, timecode, fps=24.0):
         """
         Convert HH:MM:SS or HH:MM:SS:FF or HH:MM:SS,MMM timecode to frames
@@ -2286,110 +2836,64 @@ except Exception as e:
             int: Frame number
         """
         try:
-            self.debug_print(f"Converting timecode {timecode} using {fps} fps")
-            
-            # Check if we have a DaVinci Resolve style timecode with HH:MM:SS:FF
-            if len(timecode.split(':')) == 4:
-                hours, minutes, seconds, frames = map(int, timecode.split(':'))
-                total_frames = (hours * 3600 + minutes * 60 + seconds) * fps + frames
-                return int(total_frames)
-            
-            # Handle milliseconds which could be comma or period separated
-            ms = 0
-            if '.' in timecode:
-                time_parts, ms_part = timecode.split('.')
-                ms = int(ms_part) if ms_part else 0
-            elif ',' in timecode:
-                time_parts, ms_part = timecode.split(',')
-                ms = int(ms_part) if ms_part else 0
-            else:
-                time_parts = timecode
-            
-            # Split time parts
-            parts = time_parts.split(':')
-            if len(parts) == 3:  # HH:MM:SS
-                hours, minutes, seconds = map(int, parts)
-            elif len(parts) == 2:  # MM:SS
-                hours = 0
-                minutes, seconds = map(int, parts)
-            else:
-                self.debug_print(f"Invalid timecode format: {timecode}")
+            self.debug_print("Converting timecode %s using %s fps", timecode, fps)
+
+            # Memoized parse + numeric core (the cache lives on the pure
+            # module-level function, not on self)
+            frame_number = _tc_to_frames_cached(timecode, fps)
+            if frame_number is None:
+                self.debug_print("Invalid timecode format: %s", timecode)
                 return 0
-            
-            # Calculate total seconds with proper millisecond handling
-            if ms > 0:
-                if ms < 100:  # If ms is less than 100, assume it's already in frames rather than milliseconds
-                    frame_portion = ms
-                else:  # Convert milliseconds to frames
-                    frame_portion = (ms / 1000.0) * fps
-            else:
-                frame_portion = 0
-                
-            # Calculate total frames
-            total_seconds = hours * 3600 + minutes * 60 + seconds
-            total_frames = (total_seconds * fps) + frame_portion
-            
-            # Apply frame offset compensation for better sync
-            # Resolve tends to need a slight offset for accurate positioning
-            offset_frames = self._get_timecode_offset(fps)
-            compensated_frames = int(total_frames) + offset_frames
-            
-            self.debug_print(f"Calculated frame position: {int(total_frames)} → {compensated_frames} (with offset {offset_frames})")
-            return max(0, compensated_frames)  # Ensure non-negative frame number
+
+            self.debug_print("Calculated frame position: %s", frame_number)
+            return frame_number
         except Exception as e:
             self.debug_print(f"Invalid timecode format: {timecode} - Error: {e}")
             return 0
 
-    def _get_timecode_offset(self, fps):
-        """
-        Get the appropriate frame offset compensation based on framerate
-        
-        Args:
-            fps (float): Framerate of the video
-            
-        Returns:
-            int: Frame offset to apply
-        """
-        # These offsets are for fine-tuning the frame calculations
-        # Different framerates may need different offsets for perfect accuracy
-        if fps >= 59 and fps <= 60:    # 59.94/60 fps
-            return 0
-        elif fps >= 29 and fps <= 30:  # 29.97/30 fps
-            return 0  
-        elif fps >= 23 and fps <= 24:  # 23.976/24 fps
-            return 0
-        elif fps >= 25 and fps <= 25.1: # 25 fps (PAL)
-            return 0
-        else:
-            return 0
-    
     def load_preferences(self):
         """Load preferences from file or create default preferences if file doesn't exist"""
-        prefs_path = os.path.join(self.script_dir, PREFS_FILENAME)
-        self.debug_print(f"Loading preferences from: {prefs_path}")
-        
+        self.debug_print(f"Loading preferences from: {self._prefs_path}")
+
         try:
-            if os.path.exists(prefs_path):
-                with open(prefs_path, 'r') as f:
-                    prefs = json.load(f)
+            # Open directly and let a missing file fall through to the
+            # defaults; an os.path.exists probe would be a second lookup.
+            # Read the whole file as bytes and hand it to json.loads - the C
+            # decoder works best on one buffer, and this is on the startup
+            # critical path
+            try:
+                f = open(self._prefs_path, 'rb')
+            except FileNotFoundError:
+                f = None
+            if f is not None:
+                with f:
+                    prefs = json.loads(f.read())
                     self.debug_print(f"Loaded preferences: {prefs}")
-                    
-                    # Ensure all expected keys are present
-                    for key in DEFAULT_PREFS.keys():
+
+                    # Ensure all expected keys are present; iterating items()
+                    # avoids building a keys() view and re-looking-up each
+                    # default from DEFAULT_PREFS
+                    for key, default in DEFAULT_PREFS.items():
                         if key not in prefs:
-                            prefs[key] = DEFAULT_PREFS[key]
-                            self.debug_print(f"Added missing preference: {key} = {DEFAULT_PREFS[key]}")
-                    
-                    # Validate directory paths
+                            prefs[key] = default
+                            self.debug_print("Added missing preference: %s = %s", key, default)
+
+                    # Validate directory paths with one stat() per entry
+                    # (os.path.exists + os.path.isdir would stat each twice,
+                    # which adds up on network drives)
                     valid_dirs = []
-                    for dir_path in prefs.get("directories", []):
-                        if os.path.exists(dir_path) and os.path.isdir(dir_path):
+                    for dir_path in prefs["directories"]:
+                        try:
+                            is_dir = stat.S_ISDIR(os.stat(dir_path).st_mode)
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
                             valid_dirs.append(dir_path)
                         else:
-                            self.debug_print(f"Ignoring non-existent directory from preferences: {dir_path}")
-                    
+                            self.debug_print("Ignoring non-existent directory from preferences: %s", dir_path)
+
                     prefs["directories"] = valid_dirs
-                    
+
                     return prefs
         except Exception as e:
             self.debug_print(f"Error loading preferences: {e}")
@@ -2398,15 +2902,28 @@ except Exception as e:
         self.debug_print("Using default preferences")
         return DEFAULT_PREFS.copy()
     
+    def _refresh_min_duration_cache(self):
+        """Mirror the minimum-duration settings onto attributes for the per-clip import path"""
+        self._min_dur_enabled = self.preferences.get("min_duration_enabled", True)
+        self._min_dur_seconds = self.preferences.get("min_duration_seconds", 10.0)
+
     def save_preferences(self):
         """Save preferences to file"""
-        prefs_path = os.path.join(self.script_dir, PREFS_FILENAME)
+        prefs_path = self._prefs_path
         self.debug_print(f"Saving preferences to: {prefs_path}")
+        # Every settings change funnels through here, so this keeps the
+        # hot-path mirror in sync
+        self._refresh_min_duration_cache()
         
         try:
-            with open(prefs_path, 'w') as f:
-                json.dump(self.preferences, f, indent=4)
-                self.debug_print("Preferences saved successfully")
+            # Write to a temp file and atomically swap it in so a crash
+            # mid-write can't leave a corrupt preferences file; compact
+            # separators skip the indent formatter's whitespace emission
+            tmp_path = prefs_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.preferences, f, separators=(",", ":"))
+            os.replace(tmp_path, prefs_path)
+            self.debug_print("Preferences saved successfully")
         except Exception as e:
             self.debug_print(f"Error saving preferences: {e}")
             self.status_var.set(f"Error saving preferences: {e}")
@@ -2434,6 +2951,25 @@ except Exception as e:
         else:
             return self.get_default_window_size(window_type)
     
+    def _on_root_configure(self, event):
+        """Cache the root window geometry from <Configure> events"""
+        if event.widget is self.root:
+            self._root_geom = (event.x, event.y, event.width, event.height)
+
+    def _center_on_root(self, width, height):
+        """Return (x, y) placing a width x height window centered over the root.
+
+        Uses the geometry cached by the <Configure> binding when available,
+        so the common path costs no Tcl round trips; falls back to winfo_*
+        calls before the first Configure event arrives.
+        """
+        if self._root_geom is not None:
+            root_x, root_y, root_w, root_h = self._root_geom
+        else:
+            root_x, root_y = self.root.winfo_x(), self.root.winfo_y()
+            root_w, root_h = self.root.winfo_width(), self.root.winfo_height()
+        return root_x + (root_w - width) // 2, root_y + (root_h - height) // 2
+
     def save_window_size(self, window_type, width, height):
         """Save window size for a specific window type (only if different from default)"""
         default_width, default_height = self.get_default_window_size(window_type)
@@ -2474,26 +3010,30 @@ except Exception as e:
     
     def get_current_directory(self):
         """Get the current directory with a consistent format"""
-        return os.path.abspath(".")
+        return self._cwd
         
     def update_directory_listbox(self):
         """Update the directory listbox with current preferences"""
-        self.dir_listbox.delete(0, tk.END)
-        
-        # Add current directory if not excluded
+        # Build the final list in Python first so the refresh is one delete
+        # and one vararg insert instead of a Tcl round trip per entry
         current_dir = self.get_current_directory()
+        items = []
+
+        # Add current directory if not excluded
         if not self.preferences.get("exclude_current_dir", False):
-            self.dir_listbox.insert(tk.END, current_dir + " (Current)")
-        
-        # Add all directories from preferences
-        for directory in self.preferences.get("directories", []):
-            # Don't add the current directory twice
-            if directory != current_dir:
-                self.dir_listbox.insert(tk.END, directory)
-                
+            items.append(current_dir + " (Current)")
+
+        # Add all directories from preferences (don't add the current directory twice)
+        items.extend(directory for directory in self.preferences.get("directories", [])
+                     if directory != current_dir)
+
+        self.dir_listbox.delete(0, tk.END)
+        if items:
+            self.dir_listbox.insert(tk.END, *items)
+
         # If the listbox is empty, we don't force add current directory anymore
         # This prevents recursive load_shows() calls when no valid shows exist
-        if self.dir_listbox.size() == 0:
+        if not items:
             self.debug_print("No directories in listbox, but not forcing current directory")
 
     def add_directory_warning_logic(self, directory_to_add, existing_directories):
@@ -2509,31 +3049,40 @@ except Exception as e:
                 that would cause directory_to_add to be filtered out, or None
         """
         normalized_new = os.path.normpath(directory_to_add)
-        
-        # Check if directory is a subdirectory of an existing directory
-        for existing in existing_directories:
-            normalized_existing = os.path.normpath(existing)
-            if normalized_new.startswith(normalized_existing + os.sep):
-                return True, existing
-        
-        # Check if directory is a parent of any existing directory
-        child_dirs = []
-        for existing in existing_directories:
-            normalized_existing = os.path.normpath(existing)
-            if normalized_existing.startswith(normalized_new + os.sep):
-                child_dirs.append(existing)
-        
+        new_prefix = normalized_new + os.sep
+
+        # Normalize the existing entries once, keeping the raw form for the
+        # return value
+        normalized_existing = {os.path.normpath(existing): existing
+                               for existing in existing_directories}
+
+        # Check if directory is a subdirectory of an existing directory by
+        # walking up its ancestors and testing set membership — O(depth)
+        # instead of a startswith scan over every entry
+        ancestor = os.path.dirname(normalized_new)
+        while True:
+            if ancestor in normalized_existing:
+                return True, normalized_existing[ancestor]
+            next_ancestor = os.path.dirname(ancestor)
+            if next_ancestor == ancestor:
+                break
+            ancestor = next_ancestor
+
+        # Check if directory is a parent of any existing directory with a
+        # single prefix pass over the normalized forms
+        child_dirs = [existing for normed, existing in normalized_existing.items()
+                      if normed.startswith(new_prefix)]
         if child_dirs:
             return True, child_dirs
-        
-        return False, None 
+
+        return False, None
     
     def add_directory(self):
         """Open file dialog to add directories to preferences"""
+        _load_dialog_modules()
         # Get saved size and calculate centered position BEFORE creating window
         dialog_width, dialog_height = self.get_window_size("add_directory_dialog")
-        dialog_x = self.root.winfo_x() + (self.root.winfo_width() - dialog_width) // 2
-        dialog_y = self.root.winfo_y() + (self.root.winfo_height() - dialog_height) // 2
+        dialog_x, dialog_y = self._center_on_root(dialog_width, dialog_height)
         
         # Create dialog window
         root = tk.Toplevel(self.root)
@@ -2609,7 +3158,7 @@ except Exception as e:
             
             if new_dir:
                 # Get existing directories from the listbox
-                existing_dirs = [listbox.get(i) for i in range(listbox.size())]
+                existing_dirs = list(listbox.get(0, tk.END))  # one Tcl call instead of one per item
                 
                 # Check if it's the current directory - if so, suggest using the toggle instead
                 if os.path.normpath(new_dir) == os.path.normpath(current_dir):
@@ -2621,7 +3170,7 @@ except Exception as e:
                 
                 # Check if the directory is already in the list
                 if new_dir in existing_dirs:
-                    self.debug_print(f"Directory already exists in list: {new_dir}")
+                    self.debug_print("Directory already exists in list: %s", new_dir)
                     messagebox.showinfo("Directory Exists", "This directory is already in the list.")
                     return
                     
@@ -2637,17 +3186,20 @@ except Exception as e:
                         add_anyway = messagebox.askyesno("Directory Conflict", message + "\n\nAdd parent directory anyway?")
                         
                         if add_anyway:
-                            # First remove the child directories
-                            for child in reason:
-                                for i in range(listbox.size()):
-                                    if listbox.get(i) == child:
-                                        listbox.delete(i)
-                                        self.debug_print(f"Removed child directory: {child}")
-                                        break
+                            # First remove the child directories: snapshot the
+                            # listbox once and delete by index (highest first so
+                            # earlier indices stay valid) instead of rescanning
+                            # the whole listbox per child
+                            index_map = {item: i for i, item in enumerate(listbox.get(0, tk.END))}
+                            for child in sorted(reason, key=lambda c: index_map.get(c, -1), reverse=True):
+                                child_index = index_map.get(child)
+                                if child_index is not None:
+                                    listbox.delete(child_index)
+                                    self.debug_print("Removed child directory: %s", child)
                             
                             # Now add the new directory
                             listbox.insert(tk.END, new_dir)
-                            self.debug_print(f"Added parent directory: {new_dir}")
+                            self.debug_print("Added parent directory: %s", new_dir)
                     else:
                         # This is a subdirectory of an existing directory
                         message = (f"The directory you selected is inside an existing directory:\n\n• {reason}\n\n"
@@ -2660,7 +3212,7 @@ except Exception as e:
                 else:
                     # No conflicts, add normally
                     listbox.insert(tk.END, new_dir)
-                    self.debug_print(f"Added directory without conflicts: {new_dir}")
+                    self.debug_print("Added directory without conflicts: %s", new_dir)
         
         # Function to toggle current directory inclusion
         def toggle_current_dir():
@@ -2682,13 +3234,13 @@ except Exception as e:
             selected = list(listbox.curselection())
             selected.reverse()  # Reverse to delete from bottom to top
             for i in selected:
-                self.debug_print(f"Removed directory: {listbox.get(i)}")
+                self.debug_print("Removed directory: %s", listbox.get(i))
                 listbox.delete(i)
         
         # Function to save and close
         def save_and_close():
             # Get all directories from the listbox
-            new_dirs = [listbox.get(i) for i in range(listbox.size())]
+            new_dirs = list(listbox.get(0, tk.END))  # one Tcl call instead of one per item
             self.debug_print(f"Directory dialog - new directories: {new_dirs}")
             
             # Keep track of current directory
@@ -2724,8 +3276,9 @@ except Exception as e:
                 # Check if we loaded any shows
                 if len(self.show_name_to_path_map) > 0:
                     self.debug_print(f"Directory dialog - loaded shows: {len(shows_paths)}, names: {list(self.show_name_to_path_map.keys())}")
-                    self.map_subtitles_to_videos()
-                    
+                    # Map subtitles off the UI thread, same as startup does
+                    self._map_subtitles_in_background()
+
                     # Force the dropdown to update with the new values
                     self.debug_print(f"Directory dialog - updating dropdown with {len(self.show_name_to_path_map)} shows")
                     self.update_show_dropdown()
@@ -2794,9 +3347,9 @@ except Exception as e:
                     continue
                     
                 # Check if the directory is already in the list
-                existing_dirs = [listbox.get(i) for i in range(listbox.size())]
+                existing_dirs = list(listbox.get(0, tk.END))  # one Tcl call instead of one per item
                 if new_dir in existing_dirs:
-                    self.debug_print(f"Directory already exists in list: {new_dir}")
+                    self.debug_print("Directory already exists in list: %s", new_dir)
                     messagebox.showinfo("Directory Exists", "This directory is already in the list.")
                     continue
                     
@@ -2812,18 +3365,21 @@ except Exception as e:
                         add_anyway = messagebox.askyesno("Directory Conflict", message + "\n\nAdd parent directory anyway?")
                         
                         if add_anyway:
-                            # First remove the child directories
-                            for child in reason:
-                                for i in range(listbox.size()):
-                                    if listbox.get(i) == child:
-                                        listbox.delete(i)
-                                        self.debug_print(f"Removed child directory: {child}")
-                                        break
+                            # First remove the child directories: snapshot the
+                            # listbox once and delete by index (highest first so
+                            # earlier indices stay valid) instead of rescanning
+                            # the whole listbox per child
+                            index_map = {item: i for i, item in enumerate(listbox.get(0, tk.END))}
+                            for child in sorted(reason, key=lambda c: index_map.get(c, -1), reverse=True):
+                                child_index = index_map.get(child)
+                                if child_index is not None:
+                                    listbox.delete(child_index)
+                                    self.debug_print("Removed child directory: %s", child)
                             
                             # Now add the new directory
                             listbox.insert(tk.END, new_dir)
                             added_dirs.append(new_dir)
-                            self.debug_print(f"Added parent directory: {new_dir}")
+                            self.debug_print("Added parent directory: %s", new_dir)
                     else:
                         # This is a subdirectory of an existing directory
                         message = (f"The directory you selected is inside an existing directory:\n\n• {reason}\n\n"
@@ -2833,12 +3389,12 @@ except Exception as e:
                         if add_anyway:
                             listbox.insert(tk.END, new_dir)
                             added_dirs.append(new_dir)
-                            self.debug_print(f"Added parent directory: {new_dir}")
+                            self.debug_print("Added parent directory: %s", new_dir)
                 else:
                     # No conflicts, add normally
                     listbox.insert(tk.END, new_dir)
                     added_dirs.append(new_dir)
-                    self.debug_print(f"Added directory without conflicts: {new_dir}")
+                    self.debug_print("Added directory without conflicts: %s", new_dir)
                     
             # Show the dialog again
             root.deiconify()
@@ -2907,10 +3463,11 @@ except Exception as e:
             # Clear existing show map and reload everything
             self.show_name_to_path_map.clear()
             
-            # Reload shows and remap files
+            # Reload shows on the UI thread and remap files in the background,
+            # same split the startup path uses
             shows_paths = self.load_shows()
-            self.map_subtitles_to_videos()
-            
+            self._map_subtitles_in_background()
+
             # Update status message
             if len(self.show_name_to_path_map) > 0:
                 self.status_var.set(f"Current directory excluded. Found {len(self.show_name_to_path_map)} shows")
@@ -2932,10 +3489,10 @@ except Exception as e:
             # Update the listbox
             self.update_directory_listbox()
             
-            # Reload shows and remap files
+            # Reload shows on the UI thread and remap files in the background
             shows_paths = self.load_shows()
-            self.map_subtitles_to_videos()
-            
+            self._map_subtitles_in_background()
+
             # Update status and show guidance if needed
             if len(self.show_name_to_path_map) > 0:
                 self.status_var.set(f"Removed directory: {selected_dir}. Found {len(self.show_name_to_path_map)} shows")
@@ -2962,6 +3519,14 @@ except Exception as e:
         # self.debug_print(f"Set RESOLVE_SCRIPT_API: {default_api_path}")
         # self.debug_print(f"Set RESOLVE_SCRIPT_LIB: {default_lib_path}")
 
+    def _find_module_locations_cached(self, base_path):
+        """Memoized find_module_locations - each base path is walked once per session"""
+        module_info = self._module_locations_cache.get(base_path)
+        if module_info is None:
+            module_info = find_module_locations(base_path)
+            self._module_locations_cache[base_path] = module_info
+        return module_info
+
     def _init_davinci_resolve_api(self):
         """Initialize the DaVinci Resolve API"""
         try:
@@ -2972,93 +3537,90 @@ except Exception as e:
             config = {}
             modified = False
             
-            # Load saved paths if available
-            if os.path.exists(config_file):
-                try:
-                    with open(config_file, 'r') as f:
-                        config = json.load(f)
-                        self.debug_print(f"Loaded config from: {config_file}")
+            # Load saved paths if available, reusing the parsed dict when the
+            # file hasn't changed since the last initialization
+            try:
+                config_mtime = os.stat(config_file).st_mtime_ns
+            except OSError:
+                config_mtime = None
+            if config_mtime is not None:
+                if self._resolve_config_cache["mtime_ns"] == config_mtime:
+                    config = dict(self._resolve_config_cache["config"])
+                    self.debug_print("Reusing cached config from: %s", config_file)
+                else:
+                    try:
+                        with open(config_file, 'rb') as f:
+                            config = json.loads(f.read())
+                        self._resolve_config_cache = {"mtime_ns": config_mtime, "config": dict(config)}
+                        self.debug_print("Loaded config from: %s", config_file)
                         if "RESOLVE_SCRIPT_API" in config:
-                            self.debug_print(f"Config API path: {config['RESOLVE_SCRIPT_API']}")
+                            self.debug_print("Config API path: %s", config['RESOLVE_SCRIPT_API'])
                         if "RESOLVE_SCRIPT_LIB" in config:
-                            self.debug_print(f"Config LIB path: {config['RESOLVE_SCRIPT_LIB']}")
-                except Exception as e:
-                    self.debug_print(f"Failed to load config file: {str(e)}")
-            
-            # Get default API path based on OS
-            if sys.platform.startswith("win"):  # Windows
-                default_api_path = r"C:\ProgramData\Blackmagic Design\DaVinci Resolve\Support\Developer\Scripting"
-            elif sys.platform == "darwin":  # macOS
-                default_api_path = r"/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
-            elif sys.platform.startswith("linux"):  # Linux
-                default_api_path = r"/opt/resolve/Developer/Scripting"
-            else:
-                default_api_path = ""
-            
-            # Get default LIB path based on OS
-            if sys.platform.startswith("win"):  # Windows
-                default_lib_path = r"C:\Program Files\Blackmagic Design\DaVinci Resolve\fusionscript.dll"
-            elif sys.platform == "darwin":  # macOS
-                default_lib_path = r"/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so"
-            elif sys.platform.startswith("linux"):  # Linux
-                default_lib_path = r"/opt/resolve/libs/Fusion/fusionscript.so"
-            else:
-                default_lib_path = ""
+                            self.debug_print("Config LIB path: %s", config['RESOLVE_SCRIPT_LIB'])
+                    except Exception as e:
+                        self.debug_print("Failed to load config file: %s", e)
             
-            self.debug_print(f"Default API path: {default_api_path}")
-            self.debug_print(f"Default LIB path: {default_lib_path}")
+            # Get default API/LIB paths based on OS (resolved once at module load)
+            default_api_path = _DEFAULT_API_PATH
+            default_lib_path = _DEFAULT_LIB_PATH
+
+            self.debug_print("Default API path: %s", default_api_path)
+            self.debug_print("Default LIB path: %s", default_lib_path)
             
             # Check if default paths are valid
-            default_module_paths = find_module_locations(default_api_path)
+            default_module_paths = self._find_module_locations_cached(default_api_path)
             default_api_valid = len(default_module_paths["module_paths"]) > 0
-            default_lib_valid = os.path.isfile(default_lib_path)
+            default_lib_stat = _safe_stat(default_lib_path)
+            default_lib_valid = default_lib_stat is not None and stat.S_ISREG(default_lib_stat.st_mode)
             
-            self.debug_print(f"Default module file exists: {default_api_valid}")
-            self.debug_print(f"Default library file exists: {default_lib_valid}")
+            self.debug_print("Default module file exists: %s", default_api_valid)
+            self.debug_print("Default library file exists: %s", default_lib_valid)
             
             # Use a dialog to get custom paths if needed
             need_custom_paths = False
             
-            # Set initial API path from config or env
-            api_path = None
+            # Pick initial API path from config or env; os.environ is written
+            # once after the dialog step so each assignment doesn't pay its
+            # own putenv round trip
             if "RESOLVE_SCRIPT_API" in config:
                 api_path = config["RESOLVE_SCRIPT_API"]
-                os.environ["RESOLVE_SCRIPT_API"] = api_path
-                self.debug_print(f"Using API path from config: {api_path}")
+                self.debug_print("Using API path from config: %s", api_path)
             elif os.getenv("RESOLVE_SCRIPT_API"):
                 api_path = os.getenv("RESOLVE_SCRIPT_API")
-                self.debug_print(f"Using existing API path from env: {api_path}")
+                self.debug_print("Using existing API path from env: %s", api_path)
             else:
                 api_path = default_api_path
-                os.environ["RESOLVE_SCRIPT_API"] = api_path
-                self.debug_print(f"Using default API path: {api_path}")
-                
-            # Set initial LIB path from config or env
-            lib_path = None
+                self.debug_print("Using default API path: %s", api_path)
+
+            # Pick initial LIB path from config or env
             if "RESOLVE_SCRIPT_LIB" in config:
                 lib_path = config["RESOLVE_SCRIPT_LIB"]
-                os.environ["RESOLVE_SCRIPT_LIB"] = lib_path
-                self.debug_print(f"Using LIB path from config: {lib_path}")
+                self.debug_print("Using LIB path from config: %s", lib_path)
             elif os.getenv("RESOLVE_SCRIPT_LIB"):
                 lib_path = os.getenv("RESOLVE_SCRIPT_LIB")
-                self.debug_print(f"Using existing LIB path from env: {lib_path}")
+                self.debug_print("Using existing LIB path from env: %s", lib_path)
             else:
                 lib_path = default_lib_path
-                os.environ["RESOLVE_SCRIPT_LIB"] = lib_path
-                self.debug_print(f"Using default LIB path: {lib_path}")
+                self.debug_print("Using default LIB path: %s", lib_path)
             
             # Check if module file exists at any possible location
-            module_info = find_module_locations(api_path)
+            # Reuse the default-path walk outright when the active path is the
+            # default (the common case); otherwise hit the per-path cache
+            if api_path == default_api_path:
+                module_info = default_module_paths
+            else:
+                module_info = self._find_module_locations_cached(api_path)
             module_exists = len(module_info["module_paths"]) > 0
             
             # Print all found locations
             self.debug_print("Checking possible module locations:")
             for path in module_info["module_paths"]:
-                self.debug_print(f"  - {path}: Found")
+                self.debug_print("  - %s: Found", path)
             
             # Check if library file exists
-            lib_file_exists = os.path.isfile(lib_path)
-            self.debug_print(f"Library exists at {lib_path}: {lib_file_exists}")
+            lib_stat = _safe_stat(lib_path)
+            lib_file_exists = lib_stat is not None and stat.S_ISREG(lib_stat.st_mode)
+            self.debug_print("Library exists at %s: %s", lib_path, lib_file_exists)
             
             # If the module or library is missing, show dialog to input paths
             if not module_exists or not lib_file_exists:
@@ -3082,34 +3644,42 @@ except Exception as e:
                 # Update paths if changed
                 if result['api_path'] != api_path:
                     api_path = result['api_path']
-                    os.environ["RESOLVE_SCRIPT_API"] = api_path
                     config["RESOLVE_SCRIPT_API"] = api_path
                     modified = True
-                    self.debug_print(f"Updated API path: {api_path}")
-                
+                    self.debug_print("Updated API path: %s", api_path)
+
                 if result['lib_path'] != lib_path:
                     lib_path = result['lib_path']
-                    os.environ["RESOLVE_SCRIPT_LIB"] = lib_path
                     config["RESOLVE_SCRIPT_LIB"] = lib_path
                     modified = True
-                    self.debug_print(f"Updated LIB path: {lib_path}")
-            
+                    self.debug_print("Updated LIB path: %s", lib_path)
+
+            # Publish the final paths to the environment in one update - the
+            # DaVinciResolveScript import below reads these
+            os.environ.update({
+                "RESOLVE_SCRIPT_API": api_path,
+                "RESOLVE_SCRIPT_LIB": lib_path,
+            })
+
             # Add module paths to sys.path - SIMPLIFIED APPROACH THAT WORKS
             self.debug_print("========== FINAL PATH CONFIGURATION ==========")
-            self.debug_print(f"Using RESOLVE_SCRIPT_API: {api_path}")
-            self.debug_print(f"Using RESOLVE_SCRIPT_LIB: {lib_path}")
+            self.debug_print("Using RESOLVE_SCRIPT_API: %s", api_path)
+            self.debug_print("Using RESOLVE_SCRIPT_LIB: %s", lib_path)
             
             # Simple, proven approach: Add both API path and Modules subdirectory to sys.path
-            if api_path and os.path.exists(api_path):
-                if api_path not in sys.path:
+            if api_path and _safe_stat(api_path) is not None:
+                # Set membership instead of scanning the sys.path list per candidate
+                existing_paths = set(sys.path)
+                if api_path not in existing_paths:
                     sys.path.append(api_path)
-                    self.debug_print(f"Added API path to Python path: {api_path}")
-                
+                    existing_paths.add(api_path)
+                    self.debug_print("Added API path to Python path: %s", api_path)
+
                 # CRITICAL: Also add the Modules subdirectory (this was missing!)
                 modules_path = os.path.join(api_path, "Modules")
-                if os.path.exists(modules_path) and modules_path not in sys.path:
+                if modules_path not in existing_paths and _safe_stat(modules_path) is not None:
                     sys.path.append(modules_path)
-                    self.debug_print(f"Added Modules path to Python path: {modules_path}")
+                    self.debug_print("Added Modules path to Python path: %s", modules_path)
             
             self.debug_print("=============================================")
             
@@ -3120,13 +3690,20 @@ except Exception as e:
                     if not config:
                         if os.path.exists(config_file):
                             os.remove(config_file)
-                            self.debug_print(f"Removed empty config file: {config_file}")
+                            self.debug_print("Removed empty config file: %s", config_file)
                     else:
-                        with open(config_file, 'w') as f:
+                        # Atomic swap so a crash mid-write can't corrupt the
+                        # config; fsync before the rename so the replacement
+                        # lands on disk with its contents
+                        tmp_file = config_file + ".tmp"
+                        with open(tmp_file, 'w') as f:
                             json.dump(config, f, indent=2)
-                            self.debug_print(f"Saved custom paths to {config_file}")
+                            f.flush()
+                            os.fsync(f.fileno())
+                        os.replace(tmp_file, config_file)
+                        self.debug_print("Saved custom paths to %s", config_file)
                 except Exception as e:
-                    self.debug_print(f"Failed to save config file: {str(e)}")
+                    self.debug_print("Failed to save config file: %s", e)
             
             # Attempt to import the module
             try:
@@ -3152,10 +3729,10 @@ except Exception as e:
     def _show_resolve_paths_dialog(self, current_api, current_lib, default_api, default_lib, 
                                  default_api_valid, default_lib_valid, module_exists, lib_exists):
         """Show a dialog to get custom paths for DaVinci Resolve scripting"""
+        _load_dialog_modules()
         # Get saved size and calculate centered position BEFORE creating window
         dialog_width, dialog_height = self.get_window_size("resolve_paths_dialog")
-        dialog_x = self.root.winfo_x() + (self.root.winfo_width() - dialog_width) // 2
-        dialog_y = self.root.winfo_y() + (self.root.winfo_height() - dialog_height) // 2
+        dialog_x, dialog_y = self._center_on_root(dialog_width, dialog_height)
         
         dialog = tk.Toplevel(self.root)
         dialog.title("DaVinci Resolve Scripting Setup")
@@ -3206,9 +3783,10 @@ except Exception as e:
         api_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
         
         def browse_api():
+            api_dir = os.path.dirname(api_path_var.get())
             path = filedialog.askdirectory(
                 title="Select API Directory",
-                initialdir=os.path.dirname(api_path_var.get()) if os.path.exists(os.path.dirname(api_path_var.get())) else None
+                initialdir=api_dir if _safe_stat(api_dir) is not None else None
             )
             if path:
                 api_path_var.set(path)
@@ -3222,30 +3800,37 @@ except Exception as e:
         api_valid_label = ttk.Label(api_frame, textvariable=api_valid_var)
         api_valid_label.pack(anchor="w", pady=5)
         
+        # Remember the last validated path and verdict so the up-front check,
+        # browse callbacks and OK button don't each redo the directory walk
+        _last_api_check = [None, False]
+
         def check_api_path_valid():
             path = api_path_var.get()
+            if path == _last_api_check[0]:
+                return _last_api_check[1]
+
+            valid = False
             if not path:
                 api_valid_var.set("Error: No path specified")
                 api_valid_label.config(foreground="red")
-                return False
-                
-            # Check if path exists
-            if not os.path.exists(path):
+            elif _safe_stat(path) is None:
+                # Check if path exists
                 api_valid_var.set("Error: Directory does not exist")
                 api_valid_label.config(foreground="red")
-                return False
-                
-            # Check if module exists
-            module_info = find_module_locations(path)
-            if len(module_info["module_paths"]) > 0:
-                found_at = module_info["module_paths"][0]
-                api_valid_var.set(f"Found at: {found_at}")
-                api_valid_label.config(foreground="green")
-                return True
             else:
-                api_valid_var.set("Error: DaVinciResolveScript.py not found at this location")
-                api_valid_label.config(foreground="red")
-                return False
+                # Check if module exists
+                module_info = find_module_locations(path)
+                if len(module_info["module_paths"]) > 0:
+                    found_at = module_info["module_paths"][0]
+                    api_valid_var.set(f"Found at: {found_at}")
+                    api_valid_label.config(foreground="green")
+                    valid = True
+                else:
+                    api_valid_var.set("Error: DaVinciResolveScript.py not found at this location")
+                    api_valid_label.config(foreground="red")
+
+            _last_api_check[:] = [path, valid]
+            return valid
         
         # Default button
         def use_default_api():
@@ -3270,9 +3855,10 @@ except Exception as e:
         lib_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
         
         def browse_lib():
+            lib_dir = os.path.dirname(lib_path_var.get())
             path = filedialog.askopenfilename(
                 title="Select Library File",
-                initialdir=os.path.dirname(lib_path_var.get()) if os.path.exists(os.path.dirname(lib_path_var.get())) else None,
+                initialdir=lib_dir if _safe_stat(lib_dir) is not None else None,
                 filetypes=[("Library Files", "*.dll *.so"), ("All Files", "*.*")]
             )
             if path:
@@ -3287,22 +3873,31 @@ except Exception as e:
         lib_valid_label = ttk.Label(lib_frame, textvariable=lib_valid_var)
         lib_valid_label.pack(anchor="w", pady=5)
         
+        # Same memoization as the API check above
+        _last_lib_check = [None, False]
+
         def check_lib_path_valid():
             path = lib_path_var.get()
+            if path == _last_lib_check[0]:
+                return _last_lib_check[1]
+
+            valid = False
             if not path:
                 lib_valid_var.set("Error: No path specified")
                 lib_valid_label.config(foreground="red")
-                return False
-                
-            # Check if path exists
-            if os.path.isfile(path):
-                lib_valid_var.set("File exists")
-                lib_valid_label.config(foreground="green")
-                return True
             else:
-                lib_valid_var.set("Error: File not found")
-                lib_valid_label.config(foreground="red")
-                return False
+                # Check if the file exists
+                lib_stat = _safe_stat(path)
+                if lib_stat is not None and stat.S_ISREG(lib_stat.st_mode):
+                    lib_valid_var.set("File exists")
+                    lib_valid_label.config(foreground="green")
+                    valid = True
+                else:
+                    lib_valid_var.set("Error: File not found")
+                    lib_valid_label.config(foreground="red")
+
+            _last_lib_check[:] = [path, valid]
+            return valid
         
         # Default button
         def use_default_lib():
@@ -3360,24 +3955,25 @@ except Exception as e:
             
         video_info = self.subtitle_to_video_map[subtitle_file]
         video_file = video_info["path"]
+        video_name = os.path.basename(video_file)
         # Use fallback framerate - actual detection happens during import
         fallback_fps = 24.0  # Standard fallback, will be overridden by actual media framerate
-        
+
         try:
             # Get absolute path to the video file
             abs_video_path = self.get_absolute_path(video_file)
-            
+
             # Call the timeline import function - framerate detection and minimum duration handling happens during import!
             success = self.import_clip_to_timeline(
-                abs_video_path, 
-                start_tc=start_time, 
-                end_tc=end_time, 
+                abs_video_path,
+                start_tc=start_time,
+                end_tc=end_time,
                 fps=fallback_fps  # Used only as fallback - actual framerate detected from imported media
             )
-            
+
             if success:
                 self.debug_print(f"✅ Successfully imported clip to DaVinci Resolve timeline")
-                self.status_var.set(f"Clip {os.path.basename(video_file)} ({start_time}-{end_time}) imported to DaVinci Resolve")
+                self.status_var.set(f"Clip {video_name} ({start_time}-{end_time}) imported to DaVinci Resolve")
             else:
                 self.debug_print("❌ Failed to import clip to DaVinci Resolve timeline")
                 self.status_var.set("Failed to import clip to DaVinci Resolve timeline")
@@ -3402,10 +3998,10 @@ except Exception as e:
         Returns:
             tuple: (adjusted_start_time, adjusted_end_time) as strings
         """
-        if not self.preferences.get("min_duration_enabled", True):  # Changed default to True
+        if not self._min_dur_enabled:
             return start_time, end_time
-            
-        min_seconds = self.preferences.get("min_duration_seconds", 10.0)
+
+        min_seconds = self._min_dur_seconds
         
         # Convert times to seconds for easier math
         start_seconds = self._timecode_to_seconds(start_time)
@@ -3428,9 +4024,12 @@ except Exception as e:
         new_start_seconds = max(0, start_seconds - time_to_add_each_side)
         new_end_seconds = end_seconds + time_to_add_each_side
         
-        # If we couldn't add enough at the start (because we hit 0), add more to the end
-        if new_start_seconds > 0 and start_seconds - time_to_add_each_side < 0:
-            shortfall = abs(start_seconds - time_to_add_each_side)
+        # If we couldn't add enough at the start (because we hit 0), add more
+        # to the end. The sign is known here, so no abs() is needed - and the
+        # old "new_start_seconds > 0 and ..." guard could never fire since the
+        # max(0, ...) clamp forces new_start_seconds to 0 in exactly this case.
+        if start_seconds < time_to_add_each_side:
+            shortfall = time_to_add_each_side - start_seconds
             new_end_seconds += shortfall
             self.debug_print(f"Hit start boundary, adding extra {shortfall:.1f}s to end")
         
@@ -3445,49 +4044,18 @@ except Exception as e:
     def _timecode_to_seconds(self, timecode):
         """Convert HH:MM:SS or HH:MM:SS.MS timecode to seconds"""
         try:
-            # Handle milliseconds which could be comma or period separated
-            if '.' in timecode:
-                time_parts, ms_part = timecode.split('.')
-                ms = int(ms_part) if ms_part else 0
-            elif ',' in timecode:
-                time_parts, ms_part = timecode.split(',')
-                ms = int(ms_part) if ms_part else 0
-            else:
-                time_parts = timecode
-                ms = 0
-            
-            # Split time parts
-            parts = time_parts.split(':')
-            if len(parts) == 3:  # HH:MM:SS
-                hours, minutes, seconds = map(int, parts)
-            elif len(parts) == 2:  # MM:SS
-                hours = 0
-                minutes, seconds = map(int, parts)
-            else:
-                return 0
-            
-            # Calculate total seconds
-            total_seconds = hours * 3600 + minutes * 60 + seconds
-            if ms > 0:
-                total_seconds += ms / 1000.0
-                
-            return total_seconds
+            # One precompiled regex match plus memoization - subtitle
+            # timestamps repeat across searches, so most calls are cache hits
+            return _tc_to_seconds_cached(timecode)
         except Exception:
             return 0
 
     def _seconds_to_timecode(self, total_seconds):
         """Convert seconds to HH:MM:SS format"""
         try:
-            # Ensure non-negative
-            total_seconds = max(0, total_seconds)
-            
-            # Calculate hours, minutes, seconds
-            hours = int(total_seconds // 3600)
-            minutes = int((total_seconds % 3600) // 60)
-            seconds = int(total_seconds % 60)
-            
-            # Format as HH:MM:SS
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            # Clamp, floor to whole seconds, then format via the memoized
+            # helper - the same values recur constantly across imports
+            return _fmt_tc(max(0, int(total_seconds)))
         except Exception:
             return "00:00:00"
 
@@ -3495,8 +4063,7 @@ except Exception as e:
         """Show a dialog with editor settings"""
         # Get saved size and calculate centered position BEFORE creating window
         editor_width, editor_height = self.get_window_size("editor_dialog")
-        editor_x = self.root.winfo_x() + (self.root.winfo_width() - editor_width) // 2
-        editor_y = self.root.winfo_y() + (self.root.winfo_height() - editor_height) // 2
+        editor_x, editor_y = self._center_on_root(editor_width, editor_height)
         
         editor_dialog = tk.Toplevel(self.root)
         editor_dialog.title("Editor Navigator")
@@ -4015,7 +4582,7 @@ except Exception as e:
         for item in subtitle_items:
             # Normalize text by handling unicode line separators
             normalized_text = item['text'].replace('\u2028', ' ').replace('\u2029', ' ').replace('\n', ' ').replace('\r', ' ')
-            normalized_text = re.sub(r'\s+', ' ', normalized_text).strip()
+            normalized_text = _WS_RE.sub(' ', normalized_text).strip()
             
             if case_sensitive:
                 if text_to_find in normalized_text:
@@ -4059,20 +4626,40 @@ except Exception as e:
         """Show a dialog with minimum duration settings"""
         # Get saved size and calculate centered position BEFORE creating window
         dialog_width, dialog_height = self.get_window_size("minimum_duration_dialog")
-        dialog_x = self.root.winfo_x() + (self.root.winfo_width() - dialog_width) // 2
-        dialog_y = self.root.winfo_y() + (self.root.winfo_height() - dialog_height) // 2
-        
+        dialog_x, dialog_y = self._center_on_root(dialog_width, dialog_height)
+
+        # Reuse the dialog if it was built before - closing only hides it, so
+        # reopening skips widget construction and layout entirely
+        if self._settings_dialog is not None and self._settings_dialog.winfo_exists():
+            dialog = self._settings_dialog
+            # Refresh the bound vars from current preferences
+            self.min_duration_var.set(self.preferences.get("min_duration_enabled", True))
+            self.min_duration_seconds_var.set(str(self.preferences.get("min_duration_seconds", 10.0)))
+            dialog.geometry(f"{dialog_width}x{dialog_height}+{dialog_x}+{dialog_y}")
+            dialog.deiconify()
+            dialog.grab_set()
+            dialog.focus_set()
+            return
+
         settings_dialog = tk.Toplevel(self.root)
+        self._settings_dialog = settings_dialog
         settings_dialog.title("Minimum Import Duration")
         settings_dialog.geometry(f"{dialog_width}x{dialog_height}+{dialog_x}+{dialog_y}")
         settings_dialog.transient(self.root)
         settings_dialog.grab_set()
-        
+
         # Set minimum window size to ensure all elements are always visible
         settings_dialog.minsize(400, 350)
-        
+
         # Make dialog modal
         settings_dialog.focus_set()
+
+        # Hide instead of destroy so the next open can reuse the widgets
+        def close_settings_dialog():
+            settings_dialog.grab_release()
+            settings_dialog.withdraw()
+
+        settings_dialog.protocol("WM_DELETE_WINDOW", close_settings_dialog)
         
         # Create main container with grid layout for absolute control
         main_container = ttk.Frame(settings_dialog, padding=15)
@@ -4178,12 +4765,12 @@ except Exception as e:
         
         # Close button (no save needed since auto-save)
         close_btn = ttk.Button(
-            buttons_frame, 
-            text="Close", 
-            command=settings_dialog.destroy
+            buttons_frame,
+            text="Close",
+            command=close_settings_dialog
         )
         close_btn.pack(side="right", padx=5)
-        
+
         # Add invisible spacer row to absorb extra space when dialog is enlarged
         spacer_frame = ttk.Frame(main_container)
         spacer_frame.grid(row=7, column=0, sticky="nsew")
@@ -4199,17 +4786,34 @@ except Exception as e:
         """Show a dialog with general application settings"""
         # Get saved size and calculate centered position BEFORE creating window
         dialog_width, dialog_height = self.get_window_size("general_settings_dialog")
-        dialog_x = self.root.winfo_x() + (self.root.winfo_width() - dialog_width) // 2
-        dialog_y = self.root.winfo_y() + (self.root.winfo_height() - dialog_height) // 2
-        
+        dialog_x, dialog_y = self._center_on_root(dialog_width, dialog_height)
+
+        # Reuse the dialog if it was built before (closing only hides it)
+        if self._general_settings_dialog is not None and self._general_settings_dialog.winfo_exists():
+            dialog = self._general_settings_dialog
+            dialog._consecutive_var.set(self.preferences.get("always_consecutive_search", False))
+            dialog.geometry(f"{dialog_width}x{dialog_height}+{dialog_x}+{dialog_y}")
+            dialog.deiconify()
+            dialog.grab_set()
+            dialog.focus_set()
+            return
+
         settings_dialog = tk.Toplevel(self.root)
+        self._general_settings_dialog = settings_dialog
         settings_dialog.title("General Settings")
         settings_dialog.geometry(f"{dialog_width}x{dialog_height}+{dialog_x}+{dialog_y}")
         settings_dialog.transient(self.root)
         settings_dialog.grab_set()
-        
+
         # Make dialog modal
         settings_dialog.focus_set()
+
+        # Hide instead of destroy so the next open can reuse the widgets
+        def close_general_settings_dialog():
+            settings_dialog.grab_release()
+            settings_dialog.withdraw()
+
+        settings_dialog.protocol("WM_DELETE_WINDOW", close_general_settings_dialog)
         
         # Create main frame with padding
         main_frame = ttk.Frame(settings_dialog, padding=15)
@@ -4223,9 +4827,11 @@ except Exception as e:
         search_frame = ttk.LabelFrame(main_frame, text="Search Settings", padding=10)
         search_frame.pack(fill="x", pady=10)
         
-        # Always Consecutive Search Setting with auto-save
+        # Always Consecutive Search Setting with auto-save; kept on the dialog
+        # so the reuse path above can refresh it from preferences
         always_consecutive_var = tk.BooleanVar(value=self.preferences.get("always_consecutive_search", False))
-        
+        settings_dialog._consecutive_var = always_consecutive_var
+
         def on_consecutive_changed():
             """Auto-save when setting changes"""
             self.preferences["always_consecutive_search"] = always_consecutive_var.get()
@@ -4264,9 +4870,9 @@ except Exception as e:
         
         # Close button (no save needed since auto-save)
         close_btn = ttk.Button(
-            buttons_frame, 
-            text="Close", 
-            command=settings_dialog.destroy
+            buttons_frame,
+            text="Close",
+            command=close_general_settings_dialog
         )
         close_btn.pack(side="right", padx=5)
 
@@ -4274,8 +4880,7 @@ except Exception as e:
         """Show a dialog for configuring window sizes"""
         # Get saved size and calculate centered position BEFORE creating window
         dialog_width, dialog_height = self.get_window_size("window_sizing_dialog")
-        dialog_x = self.root.winfo_x() + (self.root.winfo_width() - dialog_width) // 2
-        dialog_y = self.root.winfo_y() + (self.root.winfo_height() - dialog_height) // 2
+        dialog_x, dialog_y = self._center_on_root(dialog_width, dialog_height)
         
         dialog = tk.Toplevel(self.root)
         dialog.title("Window Sizing Settings")
@@ -4701,7 +5306,7 @@ except Exception as e:
                 self.debug_print(f"Resized and centered main window to {width}x{height}")
             
             # Apply to debug window if open
-            if hasattr(self, 'debug_window') and self.debug_window and self.debug_window.winfo_exists():
+            if hasattr(self, 'debug_window') and self.debug_window and self.debug_window._built and self.debug_window.winfo_exists():
                 if "debug_window" in new_sizes:
                     width, height = new_sizes["debug_window"]
                     self.debug_window.window.geometry(f"{width}x{height}")
@@ -4715,8 +5320,71 @@ except Exception as e:
         except Exception as e:
             self.debug_print(f"Error applying sizes to open windows: {e}")
 
+    def _guidance_on_close(self):
+        """Hide the guidance dialog (kept alive for reuse) and drop its grab"""
+        self.guidance_dialog_showing = False
+        self._guidance_dialog.grab_release()
+        self._guidance_dialog.withdraw()
+
+    def _guidance_open_dir(self):
+        """Open the current directory in the platform file manager"""
+        # Launched off the Tk thread because os.startfile / the file-manager
+        # spawn can stall for a noticeable moment, freezing the event loop
+        current_dir = self.get_current_directory()
+
+        def _launch():
+            try:
+                _OPEN_DIR(current_dir)
+            except Exception as e:
+                # Tk objects are only touched from the main thread
+                self.root.after(0, lambda e=e: (
+                    self.debug_print("Error opening directory: %s", e),
+                    self.status_var.set(f"Error opening directory: {e}")))
+
+        threading.Thread(target=_launch, daemon=True).start()
+
+    def _guidance_refresh(self):
+        """Rescan for shows from the guidance dialog's Refresh button"""
+        self.debug_print("Refreshing shows from current directory")
+
+        # Ensure current directory is included - only touch (and persist)
+        # the preference when it actually needs to change
+        if self.preferences.get("exclude_current_dir", False):
+            self.preferences["exclude_current_dir"] = False
+            self.save_preferences()
+            self.update_directory_listbox()
+
+        # No mtime-based skip here: directory mtimes only reflect direct
+        # children, so files added deeper in a show tree would make an
+        # explicit Refresh click report "no changes" - always rescan
+
+        # Clear existing show map and reload everything
+        self.show_name_to_path_map.clear()
+
+        # Reload shows and remap files
+        shows_paths = self.load_shows()
+
+        # Check if we found any shows
+        if len(self.show_name_to_path_map) > 0:
+            self.map_subtitles_to_videos()
+            self.update_show_dropdown()
+            self.status_var.set(f"Found {len(self.show_name_to_path_map)} shows with {len(self.subtitle_to_video_map)} mapped videos.")
+            self._guidance_on_close()  # Close the dialog if shows were found
+        else:
+            self.status_var.set("No shows found in current directory. Please create show folders with subtitle files.")
+
+    def _guidance_add_dir(self):
+        """Close the guidance dialog and open the Add Directory dialog"""
+        self._guidance_on_close()
+        self.root.after(100, self.add_directory)
+
+    def _guidance_show_help(self):
+        """Show the detailed-help message box"""
+        messagebox.showinfo("How It Works", _HELP_TEXT)
+
     def _delayed_show_guidance(self):
         """Show guidance dialog after initial rendering"""
+        _load_dialog_modules()
         # Check if guidance dialog is already showing
         if hasattr(self, 'guidance_dialog_showing') and self.guidance_dialog_showing:
             self.debug_print("Guidance dialog already showing, not creating another one")
@@ -4727,23 +5395,33 @@ except Exception as e:
         
         # Get saved size and calculate centered position BEFORE creating window
         dialog_width, dialog_height = self.get_window_size("guidance_dialog")
-        dialog_x = self.root.winfo_x() + (self.root.winfo_width() - dialog_width) // 2
-        dialog_y = self.root.winfo_y() + (self.root.winfo_height() - dialog_height) // 2
-        
+        dialog_x, dialog_y = self._center_on_root(dialog_width, dialog_height)
+
+        # Reuse the dialog if it was built before - most users see it once,
+        # but reshows skip rebuilding the ~15 widgets below
+        if self._guidance_dialog is not None and self._guidance_dialog.winfo_exists():
+            dialog = self._guidance_dialog
+            dialog.geometry(f"{dialog_width}x{dialog_height}+{dialog_x}+{dialog_y}")
+            dialog.deiconify()
+            dialog.grab_set()
+            dialog.lift()
+            dialog.focus_force()
+            return
+
         # Create the dialog window
         guidance_dialog = tk.Toplevel(self.root)
+        self._guidance_dialog = guidance_dialog
         guidance_dialog.title("Welcome to Rapid Moment Navigator")
         guidance_dialog.geometry(f"{dialog_width}x{dialog_height}+{dialog_x}+{dialog_y}")
         guidance_dialog.transient(self.root)
+        guidance_dialog.resizable(False, False)  # Fixed copy, no reflow needed
         guidance_dialog.grab_set()
         
-        # Function to handle dialog close
-        def on_dialog_close():
-            self.guidance_dialog_showing = False
-            guidance_dialog.destroy()
-            
-        # Set the close protocol
-        guidance_dialog.protocol("WM_DELETE_WINDOW", on_dialog_close)
+        # Closing hides rather than destroys so the widgets can be reused
+        # next time; handlers are bound methods registered once here at
+        # build time, so reopening the dialog allocates no fresh closures
+        guidance_dialog.protocol("WM_DELETE_WINDOW", self._guidance_on_close)
+        guidance_dialog.bind("<Escape>", lambda e: self._guidance_on_close())
         
         # Create main frame with padding
         main_frame = ttk.Frame(guidance_dialog, padding=15)
@@ -4754,18 +5432,7 @@ except Exception as e:
         title_label.pack(anchor="center", pady=(0, 20))
         
         # Explanation text
-        explanation_text = (
-            "Rapid Moment Navigator needs to know where your media is located.\n\n"
-            "You need to add directories that contain subtitle (.SRT) files and their corresponding video files.\n\n"
-            "How it works:\n"
-            "1. The app will scan directories for subtitle files (.SRT) and video files with matching names\n"
-            "2. It can scan nested folder structures - media can be anywhere in the folder hierarchy\n"
-            "3. Video files should have the same base name as their subtitle files\n"
-            "4. You can add multiple media directories\n\n"
-            "You have two options:"
-        )
-        
-        explanation_label = ttk.Label(main_frame, text=explanation_text, wraplength=550, justify="left")
+        explanation_label = ttk.Label(main_frame, text=_GUIDANCE_TEXT, justify="left")
         explanation_label.pack(pady=10, fill="x")
         
         # Options frame
@@ -4783,8 +5450,7 @@ except Exception as e:
         
         # Instructions for Option 1
         option1_instructions = ttk.Label(option1_frame, 
-                                       text="Create subfolders in this directory and add your media files + subtitles to them.",
-                                       wraplength=550)
+                                       text=textwrap.fill("Create subfolders in this directory and add your media files + subtitles to them.", 78))
         option1_instructions.pack(anchor="w", pady=5)
         
         # Button frame for Option 1
@@ -4792,48 +5458,11 @@ except Exception as e:
         option1_btn_frame.pack(anchor="w", pady=5)
         
         # Open current directory button
-        def open_current_dir():
-            try:
-                current_dir = self.get_current_directory()
-                if sys.platform.startswith('win'):
-                    os.startfile(current_dir)
-                elif sys.platform == 'darwin':  # macOS
-                    subprocess.Popen(['open', current_dir])
-                else:  # Linux
-                    subprocess.Popen(['xdg-open', current_dir])
-            except Exception as e:
-                self.debug_print(f"Error opening directory: {e}")
-                self.status_var.set(f"Error opening directory: {e}")
-        
-        open_dir_btn = ttk.Button(option1_btn_frame, text="Open Current Directory", command=open_current_dir)
+        open_dir_btn = ttk.Button(option1_btn_frame, text="Open Current Directory", command=self._guidance_open_dir)
         open_dir_btn.pack(side="left", padx=5)
         
         # Refresh shows button
-        def refresh_current_dir():
-            self.debug_print("Refreshing shows from current directory")
-            
-            # Ensure current directory is included
-            if self.preferences.get("exclude_current_dir", False):
-                self.preferences["exclude_current_dir"] = False
-                self.save_preferences()
-                self.update_directory_listbox()
-            
-            # Clear existing show map and reload everything
-            self.show_name_to_path_map.clear()
-            
-            # Reload shows and remap files
-            shows_paths = self.load_shows()
-            
-            # Check if we found any shows
-            if len(self.show_name_to_path_map) > 0:
-                self.map_subtitles_to_videos()
-                self.update_show_dropdown()
-                self.status_var.set(f"Found {len(self.show_name_to_path_map)} shows with {len(self.subtitle_to_video_map)} mapped videos.")
-                on_dialog_close()  # Close the dialog if shows were found
-            else:
-                self.status_var.set("No shows found in current directory. Please create show folders with subtitle files.")
-        
-        refresh_btn = ttk.Button(option1_btn_frame, text="Refresh Shows", command=refresh_current_dir)
+        refresh_btn = ttk.Button(option1_btn_frame, text="Refresh Shows", command=self._guidance_refresh)
         refresh_btn.pack(side="left", padx=5)
         
         # Option 2: Add existing directories
@@ -4846,17 +5475,11 @@ except Exception as e:
         
         # Instructions for Option 2 - now in the horizontal frame
         option2_instructions = ttk.Label(option2_content_frame, 
-                                       text="Select directories that already contain media files and subtitles.",
-                                       wraplength=400)  # Reduced width to make room for button
+                                       text=textwrap.fill("Select directories that already contain media files and subtitles.", 56))  # Narrower to make room for button
         option2_instructions.pack(side="left", anchor="w")
         
-        # Function for Add Directory button
-        def call_add_directory():
-            on_dialog_close()  # Close the guidance dialog
-            self.root.after(100, self.add_directory)
-        
         # Create Add Directory button directly in the horizontal frame
-        add_dir_btn = ttk.Button(option2_content_frame, text="Add Directory", command=call_add_directory)
+        add_dir_btn = ttk.Button(option2_content_frame, text="Add Directory", command=self._guidance_add_dir)
         add_dir_btn.pack(side="right", padx=10)
         
         # Bottom buttons frame
@@ -4864,41 +5487,26 @@ except Exception as e:
         bottom_frame.pack(fill="x", pady=15)
         
         # Help button
-        def show_help():
-            help_text = (
-                "Detailed Help:\n\n"
-                "Subtitle files (.SRT) should match the video file names.\n"
-                "Example:\n"
-                "- video_file.mp4 → video_file.srt\n\n"
-                "The app will try to match files even with slight differences in naming.\n"
-                "Each directory you add is treated as a separate 'show' in the dropdown menu.\n\n"
-                "When you add a directory, the entire folder structure is scanned for matching\n"
-                "subtitle and video files. Files can be in subdirectories.\n\n"
-                "After adding directories, use the search box to find specific dialog,\n"
-                "then click on the timecode to play the video at that exact moment."
-            )
-            messagebox.showinfo("How It Works", help_text)
-        
-        help_btn = ttk.Button(bottom_frame, text="Detailed Help", command=show_help)
+        help_btn = ttk.Button(bottom_frame, text="Detailed Help", command=self._guidance_show_help)
         help_btn.pack(side="left", padx=5)
         
         # Close button
-        close_btn = ttk.Button(bottom_frame, text="Close", command=on_dialog_close)
+        close_btn = ttk.Button(bottom_frame, text="Close", command=self._guidance_on_close)
         close_btn.pack(side="right", padx=5)
         
-        # Ensure the dialog is visible and focused
+        # Ensure the dialog is visible and focused; every caller reaches this
+        # via root.after, so the running mainloop paints the dialog at the
+        # next idle point without an explicit pump here
         guidance_dialog.lift()
         guidance_dialog.focus_force()
-        
-        # Force update the UI to ensure all elements are rendered
-        guidance_dialog.update()
 
     def load_app_state(self):
         """Load application state from preferences"""
         try:
             # Load preferences and set them as the instance variable
             self.preferences = self.load_preferences()
-            
+            self._refresh_min_duration_cache()
+
             # Set editor
             selected_editor = self.preferences.get("selected_editor", "None")
             self.editor_var.set(selected_editor)
@@ -5063,14 +5671,17 @@ except Exception as e:
             subtitle_items = self._fetch_subtitle_items_from_resolve()
             
             if subtitle_items:
-                with self.cache_lock:
-                    self.subtitle_cache[timeline_id] = {
-                        'items': subtitle_items,
-                        'timestamp': time.time(),
-                        'timeline_id': timeline_id
-                    }
-                    self.last_timeline_id = timeline_id
-                    
+                # Copy-on-write: rebinding the attribute is atomic, so UI
+                # reads never contend with this thread
+                new_cache = dict(self.subtitle_cache)
+                new_cache[timeline_id] = {
+                    'items': subtitle_items,
+                    'timestamp': time.time(),
+                    'timeline_id': timeline_id
+                }
+                self.subtitle_cache = new_cache
+                self.last_timeline_id = timeline_id
+                
                 cache_count = len(subtitle_items)
                 self.debug_print(f"Cached {cache_count} subtitle items for timeline: {timeline_id}")
                 
@@ -5127,12 +5738,13 @@ except Exception as e:
         if not timeline_id:
             return None
             
-        with self.cache_lock:
-            cache_data = self.subtitle_cache.get(timeline_id)
-            if cache_data:
-                self.debug_print(f"Retrieved {len(cache_data['items'])} items from cache")
-                return cache_data['items']
-                
+        # Lock-free read: take a snapshot reference, writers never mutate a
+        # published dict in place
+        cache_data = self.subtitle_cache.get(timeline_id)
+        if cache_data:
+            self.debug_print("Retrieved %s items from cache", len(cache_data['items']))
+            return cache_data['items']
+            
         self.debug_print("No cached data available")
         return None
 
@@ -5162,14 +5774,17 @@ except Exception as e:
 
     def _invalidate_cache(self, timeline_id=None):
         """Invalidate cache for specific timeline or all"""
-        with self.cache_lock:
-            if timeline_id:
-                if timeline_id in self.subtitle_cache:
-                    del self.subtitle_cache[timeline_id]
-                    self.debug_print(f"Invalidated cache for timeline: {timeline_id}")
-            else:
-                self.subtitle_cache.clear()
-                self.debug_print("Invalidated entire subtitle cache")
+        # Rebind instead of mutating so concurrent readers keep a coherent
+        # snapshot of the old dict
+        if timeline_id:
+            if timeline_id in self.subtitle_cache:
+                new_cache = dict(self.subtitle_cache)
+                del new_cache[timeline_id]
+                self.subtitle_cache = new_cache
+                self.debug_print("Invalidated cache for timeline: %s", timeline_id)
+        else:
+            self.subtitle_cache = {}
+            self.debug_print("Invalidated entire subtitle cache")
 
     def _on_window_focus_in(self, event=None):
         """Handle window focus in event"""
@@ -5195,6 +5810,7 @@ except Exception as e:
         # Method 1: Traditional focus events (works on most platforms)
         self.root.bind("<FocusIn>", self._on_window_focus_in)
         self.root.bind("<FocusOut>", self._on_window_focus_out)
+        self.root.bind("<Configure>", self._on_root_configure)
         
         # Method 2: Periodic focus checking (backup method)
         self._setup_periodic_focus_check()
@@ -5404,9 +6020,9 @@ except Exception as e:
         def clean_for_search(text):
             """Clean text for more flexible searching - remove punctuation and normalize"""
             # Remove common punctuation that might interfere
-            cleaned = re.sub(r'[^\w\s]', ' ', text)
+            cleaned = _PUNCT_RE.sub(' ', text)
             # Normalize whitespace
-            cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+            cleaned = _WS_RE.sub(' ', cleaned).strip()
             return cleaned.lower()
         
         keyword_cleaned = clean_for_search(keyword)
@@ -5458,10 +6074,10 @@ except Exception as e:
         def clean_for_search(text):
             """Clean text for more flexible searching"""
             # Remove common punctuation that might interfere
-            cleaned = re.sub(r'[^\w\s]', ' ', text)
+            cleaned = _PUNCT_RE.sub(' ', text)
             # Normalize whitespace and Unicode separators
             cleaned = cleaned.replace('\u2028', ' ').replace('\u2029', ' ')
-            cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+            cleaned = _WS_RE.sub(' ', cleaned).strip()
             return cleaned if case_sensitive else cleaned.lower()
         
         search_text = text_to_find if case_sensitive else text_to_find.lower()
@@ -5498,11 +6114,42 @@ except Exception as e:
         
         return matches
 
+# Resolve the registry's method-name strings into function objects once at
+# class-definition time (the registry never changes afterwards); the
+# dispatch builder binds these directly instead of going through getattr
+for _cfg in RapidMomentNavigator.EDITOR_REGISTRY.values():
+    for _key in ("ensure_ready_method", "import_media_method",
+                 "import_clip_method", "framerate_detection_method"):
+        _name = _cfg.get(_key)
+        if _name:
+            _cfg[_key + "_fn"] = RapidMomentNavigator.__dict__.get(_name)
+del _cfg, _key, _name
+
 class DebugWindow:
     """A debug window to display errors and debug information"""
     def __init__(self, parent, auto_show=False):
         self.parent = parent
-        
+        self.window = None
+        self._built = False
+        self._auto_show = auto_show
+
+        # Messages are buffered and drained in one insert per idle cycle so a
+        # burst of debug output doesn't trigger a relayout/scroll per line
+        self._pending = []
+        self._flush_scheduled = False
+
+        # Only build the widget tree up front when the window should be
+        # visible immediately; otherwise defer it to the first use
+        if auto_show:
+            self._build()
+
+    def _build(self):
+        """Construct the Toplevel and its widgets on first use"""
+        if self._built:
+            return
+        self._built = True
+        parent = self.parent
+
         # Get parent window position and size
         parent_x = parent.winfo_x()
         parent_y = parent.winfo_y()
@@ -5554,24 +6201,52 @@ class DebugWindow:
         save_btn.pack(side="right", padx=5)
         
         # If auto_show is False, hide the window initially
-        if not auto_show:
+        if not self._auto_show:
             self.window.withdraw()
             
         # Add help text
         self.insert_text("Debug Console - Errors and detailed messages will appear here.\n")
         self.insert_text("If you encounter problems, please save this log and include it in any bug reports.\n\n")
-    
+
+    def show(self):
+        """Build if necessary and bring the window to the front"""
+        self._build()
+        self.window.deiconify()
+
     def winfo_exists(self):
-        """Check if window still exists"""
+        """Check if window still exists (an unbuilt window can still be built on demand)"""
+        if not self._built:
+            return True
         try:
             return self.window.winfo_exists()
         except:
             return False
     
     def insert_text(self, text):
-        """Insert text into the debug window"""
+        """Queue text for the debug window (flushed once per idle cycle)"""
+        try:
+            self._build()
+            self._pending.append(text)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.window.after_idle(self._flush)
+        except:
+            pass  # Silently fail if window is closed
+
+    def _flush(self):
+        """Drain the pending buffer with a single insert and one auto-scroll"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
         try:
-            self.text_area.insert(tk.END, text)
+            self.text_area.insert(tk.END, "".join(self._pending))
+            self._pending.clear()
+
+            # Keep the widget bounded so long sessions don't degrade Tk's
+            # text rendering; oldest lines are dropped once past the cap
+            line_count = int(self.text_area.index('end-1c').split('.')[0])
+            if line_count > 5000:
+                self.text_area.delete('1.0', f'{line_count - 5000}.0')
             self.text_area.see(tk.END)  # Auto-scroll to the end
             
             # Make the window visible if it's hidden
@@ -5583,23 +6258,39 @@ class DebugWindow:
     def clear_text(self):
         """Clear all text from the window"""
         try:
+            self._build()
+            self._pending.clear()
             self.text_area.delete(1.0, tk.END)
         except:
             pass
     
     def save_log(self):
         """Save the log contents to a file"""
-        try:
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".txt",
-                filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-                title="Save Debug Log"
-            )
-            if filename:
+        _load_dialog_modules()
+        self._build()
+        self._flush()  # Make sure buffered messages are in the widget first
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            title="Save Debug Log"
+        )
+        if not filename:
+            return
+
+        # Grab the text on the main thread, then write it off-thread so a
+        # slow disk or network share doesn't freeze the GUI mid-save
+        text = self.text_area.get(1.0, tk.END)
+
+        def _write():
+            try:
                 with open(filename, "w", encoding="utf-8") as f:
-                    f.write(self.text_area.get(1.0, tk.END))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save log: {e}")
+                    f.write(text)
+            except Exception as e:
+                # Report non-modally into the debug window itself
+                self.window.after(0, lambda e=e: self.insert_text(
+                    f"ERROR: Failed to save log to {filename}: {e}\n"))
+
+        threading.Thread(target=_write, daemon=True).start()
 
 if __name__ == "__main__":
     # Parse command line arguments
@@ -5623,46 +6314,50 @@ if __name__ == "__main__":
         if args.debug:
             sys.stdout.flush()
             
-        # Create menu bar
-        menu_bar = tk.Menu(root)
-        
-        # Add Settings menu with separate items
-        settings_menu = tk.Menu(menu_bar, tearoff=0)
-        settings_menu.add_command(label="Minimum Import Duration...", 
-                                 command=app._show_settings_dialog)
-        settings_menu.add_command(label="General Settings...", 
-                                 command=app._show_general_settings_dialog)
-        settings_menu.add_separator()
-        settings_menu.add_command(label="Window Sizing...", 
-                                 command=app._show_window_sizing_dialog)
-        menu_bar.add_cascade(label="Settings", menu=settings_menu)
-            
-        # Add Editor Menu
-        editor_menu = tk.Menu(menu_bar, tearoff=0)
-        editor_menu.add_command(label="Editor Navigator", 
-                                command=app._show_editor_dialog)
-        editor_menu.add_separator()
-        
-        # Add cache setting with dynamic label showing current state
-        auto_cache_enabled = app.preferences.get("auto_cache_update", True)
-        cache_label = "✓ Auto Update Cache on Focus" if auto_cache_enabled else "Auto Update Cache on Focus"
-        editor_menu.add_command(label=cache_label, 
-                                command=app._toggle_auto_cache_update)
-        
-        # Store reference for dynamic menu updates (cache item is at index 2)
-        app._set_editor_menu_reference(editor_menu, 2)
-        
-        menu_bar.add_cascade(label="Editor", menu=editor_menu)
-            
-        # Add Debug menu
-        debug_menu = tk.Menu(menu_bar, tearoff=0)
-        debug_menu.add_command(label="Show Debug Window", 
-                              command=lambda: app.ensure_debug_window() or 
-                                             (app.debug_window and app.debug_window.window.deiconify()))
-        menu_bar.add_cascade(label="Debug", menu=debug_menu)
-        
-        # Apply menu bar to root window
-        root.config(menu=menu_bar)
+        # Build the menu bar on the first idle tick instead of before
+        # mainloop - the window paints sooner and the menus attach
+        # imperceptibly later
+        def _build_menu():
+            menu_bar = tk.Menu(root)
+            
+            # Add Settings menu with separate items
+            settings_menu = tk.Menu(menu_bar, tearoff=0)
+            settings_menu.add_command(label="Minimum Import Duration...", 
+                                     command=app._show_settings_dialog)
+            settings_menu.add_command(label="General Settings...", 
+                                     command=app._show_general_settings_dialog)
+            settings_menu.add_separator()
+            settings_menu.add_command(label="Window Sizing...", 
+                                     command=app._show_window_sizing_dialog)
+            menu_bar.add_cascade(label="Settings", menu=settings_menu)
+                
+            # Add Editor Menu
+            editor_menu = tk.Menu(menu_bar, tearoff=0)
+            editor_menu.add_command(label="Editor Navigator", 
+                                    command=app._show_editor_dialog)
+            editor_menu.add_separator()
+            
+            # Add cache setting with dynamic label showing current state
+            auto_cache_enabled = app.preferences.get("auto_cache_update", True)
+            cache_label = "✓ Auto Update Cache on Focus" if auto_cache_enabled else "Auto Update Cache on Focus"
+            editor_menu.add_command(label=cache_label, 
+                                    command=app._toggle_auto_cache_update)
+            
+            # Store reference for dynamic menu updates (cache item is at index 2)
+            app._set_editor_menu_reference(editor_menu, 2)
+            
+            menu_bar.add_cascade(label="Editor", menu=editor_menu)
+                
+            # Add Debug menu
+            debug_menu = tk.Menu(menu_bar, tearoff=0)
+            debug_menu.add_command(label="Show Debug Window", 
+                                  command=app._show_debug_window)
+            menu_bar.add_cascade(label="Debug", menu=debug_menu)
+            
+            # Apply menu bar to root window
+            root.config(menu=menu_bar)
+        
+        root.after(0, _build_menu)
         
         # Start the main loop
         root.mainloop()
@@ -5671,6 +6366,7 @@ if __name__ == "__main__":
         # Handle any uncaught exceptions during initialization
         print(f"CRITICAL ERROR: {e}", file=sys.stderr)
         traceback.print_exc()
+        _load_dialog_modules()
         messagebox.showerror("Critical Error", 
                            f"The application encountered a critical error and cannot start:\n\n{str(e)}")
         sys.exit(1) 
\ No newline at end of file